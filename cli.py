@@ -3,31 +3,99 @@ CLI interface for Minecraft Launcher.
 Provides terminal-based interaction with rich formatting.
 """
 
+import contextlib
+import functools
+import re
 import sys
-from typing import Dict
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-# Try importing rich libraries with fallback
-try:
-    from rich.console import Console
-    from rich.table import Table
+# Rich markup tags such as "[bold]" or "[/red]", stripped for plain output
+_MARKUP_RE = re.compile(r"\[[^\]\n]*\]")
+
+# User-selectable settings, in display order
+_CONFIG_KEYS = ("runtime", "gpu", "display", "audio")
+
+# Repository layout: the launcher's bind-mounted home and its profile files
+_REPO_DIR = Path(__file__).parent
+_HOME_DIR = _REPO_DIR / "home"
+_PROFILES_FILE = _HOME_DIR / "launcher_profiles.json"
+_VERSIONS_DIR = _HOME_DIR / "versions"
+
+# Profile files whose formats are already compressed (stored as-is on export)
+_PRECOMPRESSED_SUFFIXES = frozenset({".jar", ".zip", ".png", ".ogg"})
+
+# Lines collected by _print() inside a _print_batch() section, None otherwise
+_print_buffer = None
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
 
-try:
-    import questionary
+class _BufferedOutput:
+    """
+    Batch streamed container output into large stdout writes.
+
+    Lines are encoded once and flushed when `max_bytes` have accumulated, or at
+    most `interval` seconds after the first pending line, so bursts of log
+    output don't pay for a write and flush per line while quiet streams still
+    appear promptly. Pending bytes are swapped out before the terminal write, so
+    the thread producing lines only waits on a slow terminal once a full batch
+    is queued. Use as a context manager to flush whatever is left on exit.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, interval: float = 0.05):
+        self._stream = getattr(sys.stdout, "buffer", None)
+        self._encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+        if max_bytes is None:
+            # Pipes and files favour throughput; a terminal favours latency
+            max_bytes = 8192 if sys.stdout.isatty() else 65536
+        self._max_bytes = max_bytes
+        self._interval = interval
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer = None
+
+    def write(self, line: str):
+        """Queue one line of output (without trailing newline)."""
+        data = (line + "\n").encode(self._encoding, "replace")
+        with self._lock:
+            self._buf += data
+            full = len(self._buf) >= self._max_bytes
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self._interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write out all pending lines."""
+        # The write lock keeps batches in order; the buffer lock is only held
+        # long enough to take the pending bytes.
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                data = bytes(self._buf)
+                self._buf.clear()
+            if not data:
+                return
+            if self._stream is not None:
+                # Drain the text layer first so earlier print() output stays in order
+                sys.stdout.flush()
+                self._stream.write(data)
+                self._stream.flush()
+            else:
+                # Text-only stdout (e.g. replaced by a test harness)
+                sys.stdout.write(data.decode(self._encoding, "replace"))
+                sys.stdout.flush()
 
-    QUESTIONARY_AVAILABLE = True
-except ImportError:
-    QUESTIONARY_AVAILABLE = False
+    def __enter__(self):
+        return self
 
-from core.composer import get_command_preview
-from core.config import load_config, merge_config
-from core.container import ContainerManager, image_exists
-from core.detector import detect_system, get_detection_details
-from core.log_analyzer import analyze_lines
-from core.validator import run_xhost_if_needed, validate_system
+    def __exit__(self, *exc):
+        self.flush()
 
 
 def run_cli(args):
@@ -37,70 +105,160 @@ def run_cli(args):
     Args:
         args: Parsed command-line arguments from argparse
     """
-    # Handle different commands
-    if args.command == "doctor":
-        run_doctor(args)
-    elif args.command == "status":
-        run_status(args)
-    elif args.command == "stop":
-        run_stop(args)
-    elif args.command == "logs":
-        run_logs(args)
-    elif args.command == "restart":
-        run_restart(args)
-    elif args.command == "stats":
-        run_stats(args)
-    elif args.command == "profiles":
-        run_profiles(args)
-    elif args.command == "start":
-        run_start(args)
-    else:
+    commands = {
+        "start": run_start,
+        "stop": run_stop,
+        "restart": run_restart,
+        "logs": run_logs,
+        "status": run_status,
+        "doctor": run_doctor,
+        "stats": run_stats,
+        "profiles": run_profiles,
+    }
+
+    handler = commands.get(args.command)
+    if handler is None:
         print(f"Unknown command: {args.command}")
         sys.exit(1)
+    handler(args)
 
 
-def run_start(args):
-    """Handle 'start' command."""
-    console = Console() if RICH_AVAILABLE else None
+@contextlib.contextmanager
+def _print_batch():
+    """
+    Collect _print() output and emit it as a single print on exit.
+
+    Rich re-parses markup and renders ANSI on every console.print call, so
+    multi-line reports are much cheaper printed as one block. Usable as a
+    decorator; nested sections join the outermost batch.
+    """
+    global _print_buffer
+    if _print_buffer is not None:
+        yield
+        return
+
+    _print_buffer = []
+    try:
+        yield
+    finally:
+        lines, _print_buffer = _print_buffer, None
+        if lines:
+            _emit("\n".join(lines))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """
+    Return a rich Console, importing rich only on first use.
+
+    Returns:
+        Console, or None if rich is not installed (plain output fallback)
+    """
+    try:
+        from rich.console import Console
+    except ImportError:
+        return None
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_questionary():
+    """
+    Return the questionary module, importing it only on first use.
+
+    Returns:
+        module, or None if questionary is not installed (input() fallback)
+    """
+    try:
+        import questionary
+    except ImportError:
+        return None
+    return questionary
+
+
+@functools.lru_cache(maxsize=1)
+def _get_orjson():
+    """
+    Return the orjson module, importing it only on first use.
+
+    Returns:
+        module, or None if orjson is not installed (stdlib json fallback)
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_cached() -> Dict[str, str]:
+    """Run system detection once per process (it shells out to several probes)."""
+    from core.detector import detect_system
 
-    # Step 1: Detect system
-    _print(console, "[yellow]Detecting system configuration...[/yellow]")
-    detected = detect_system()
+    return detect_system()
 
-    # Step 2: Load saved config
+
+def _resolve_config(args=None) -> Tuple[Dict, Dict, Dict]:
+    """
+    Detect the system, load saved config, apply command-line overrides and merge.
+
+    Args:
+        args: Parsed command-line arguments whose runtime/gpu/display/audio
+              values (if set) override the saved configuration
+
+    Returns:
+        tuple: (config, detected, saved); detected is empty when every
+        setting is already pinned by the saved config or arguments
+    """
+    from core.config import load_config, merge_config
+
+    # load_config() caches the parsed file and hands back a fresh copy
     saved = load_config()
 
-    # Step 3: Apply command-line overrides
-    if args.runtime:
-        saved["runtime"] = args.runtime
-    if args.gpu:
-        saved["gpu"] = args.gpu
-    if args.display:
-        saved["display"] = args.display
-    if args.audio:
-        saved["audio"] = args.audio
+    if args is not None:
+        for key in _CONFIG_KEYS:
+            value = getattr(args, key, None)
+            if value:
+                saved[key] = value
+
+    # Probing shells out to lspci/pactl etc.; skip it when nothing is left to detect
+    if all(str(saved.get(key) or "").strip() for key in _CONFIG_KEYS):
+        detected = {}
+    else:
+        detected = _detect_cached()
+
+    return merge_config(detected, saved), detected, saved
 
-    # Step 4: Merge configurations
-    config = merge_config(detected, saved)
+
+def run_start(args):
+    """Handle 'start' command."""
+    from core.composer import get_command_preview
+    from core.container import ContainerManager, image_exists
+    from core.validator import run_xhost_if_needed, validate_system
+
+    # Steps 1-4: Detect system, load saved config, apply overrides, merge
+    _print("[yellow]Detecting system configuration...[/yellow]")
+    config, detected, saved = _resolve_config(args)
 
     # Step 5: Show configuration
-    _show_configuration(console, config, detected, saved)
+    _show_configuration(config, detected, saved)
 
     # Step 6: Confirm (unless --yes)
     if not args.yes:
-        if not _confirm_start(console, config):
-            _print(console, "Cancelled.")
+        if not _confirm_start(config):
+            _print("Cancelled.")
             return
 
     # Step 7: Validate system
-    _print(console, "\n[yellow]Validating system...[/yellow]")
+    _print("\n[yellow]Validating system...[/yellow]")
     valid, issues = validate_system(config)
 
     if issues:
-        _show_validation_issues(console, issues)
+        _show_validation_issues(issues)
 
     if not valid:
-        _print(console, "[red]✗ System validation failed. Cannot start.[/red]")
+        _print("[red]✗ System validation failed. Cannot start.[/red]")
         sys.exit(1)
 
     # Build the image automatically if it's missing (first run). The manual
@@ -108,61 +266,62 @@ def run_start(args):
     runtime = config.get("runtime", "podman")
     if not image_exists(runtime):
         _print(
-            console,
             "[yellow]Container image not found — building it first (one time)...[/yellow]",
         )
-        if not _build_image(console, runtime):
-            _print(console, "[red]✗ Image build failed. Cannot start.[/red]")
+        if not _build_image(runtime):
+            _print("[red]✗ Image build failed. Cannot start.[/red]")
             sys.exit(1)
 
     # Step 8: Run xhost if needed (x11 and XWayland both use the X server)
     if config["display"] in ("x11", "wayland") and config.get("auto_xhost", True):
-        _print(console, "[yellow]Setting X11 permissions...[/yellow]")
+        _print("[yellow]Setting X11 permissions...[/yellow]")
         if run_xhost_if_needed(config):
-            _print(console, "[green]✓ X11 permissions set[/green]")
+            _print("[green]✓ X11 permissions set[/green]")
         else:
-            _print(console, "[yellow]⚠ Could not set X11 permissions automatically[/yellow]")
+            _print("[yellow]⚠ Could not set X11 permissions automatically[/yellow]")
 
     # Step 9: Start container
-    _print(console, "\n[green]Starting Minecraft...[/green]")
-    _print(console, f"[dim]Command: {get_command_preview(config, 'up')}[/dim]\n")
+    _print("\n[green]Starting Minecraft...[/green]")
+    if not getattr(args, "quiet", False):
+        _print(f"[dim]Command: {get_command_preview(config, 'up')}[/dim]\n")
 
     manager = ContainerManager(config)
 
     collected_lines = []
 
-    def output_handler(line):
-        print(line)
-        collected_lines.append(line)
+    with _BufferedOutput() as out:
 
-    success = manager.start(
-        detached=args.detached,
-        force_recreate=getattr(args, "force_recreate", False),
-        output_callback=output_handler,
-    )
+        def output_handler(line):
+            out.write(line)
+            collected_lines.append(line)
+
+        success = manager.start(
+            detached=args.detached,
+            force_recreate=getattr(args, "force_recreate", False),
+            output_callback=output_handler,
+        )
 
     if success:
         if args.detached:
-            _print(console, "\n[green]✓ Container started in background[/green]")
-            _print(console, f"View logs: {sys.argv[0]} --no-gui logs -f")
+            _print("\n[green]✓ Container started in background[/green]")
+            _print(f"View logs: {sys.argv[0]} --no-gui logs -f")
         else:
-            _print(console, "\n[green]✓ Container stopped[/green]")
+            _print("\n[green]✓ Container stopped[/green]")
     else:
-        _print(console, "\n[red]✗ Container exited with error[/red]")
+        _print("\n[red]✗ Container exited with error[/red]")
 
     if not args.detached:
-        _show_log_findings(console, collected_lines)
+        _show_log_findings(collected_lines)
 
     if not success:
         sys.exit(1)
 
 
-def _build_image(console, runtime: str, image: str = "tlauncher-java") -> bool:
+def _build_image(runtime: str, image: str = "tlauncher-java") -> bool:
     """Build the container image, streaming output. Returns True on success."""
     import subprocess
-    from pathlib import Path
 
-    repo_dir = str(Path(__file__).parent)
+    repo_dir = str(_REPO_DIR)
     try:
         proc = subprocess.Popen(
             [runtime, "build", "--pull", "-t", image, "."],
@@ -175,88 +334,106 @@ def _build_image(console, runtime: str, image: str = "tlauncher-java") -> bool:
             print(line.rstrip())
         proc.wait()
         if proc.returncode == 0:
-            _print(console, "[green]✓ Image built[/green]")
+            _print("[green]✓ Image built[/green]")
             return True
         return False
     except FileNotFoundError:
-        _print(console, f"[red]'{runtime}' not found — is it installed?[/red]")
+        _print(f"[red]'{runtime}' not found — is it installed?[/red]")
         return False
     except Exception as e:
-        _print(console, f"[red]Build error: {e}[/red]")
+        _print(f"[red]Build error: {e}[/red]")
         return False
 
 
 def run_stop(args):
     """Handle 'stop' command."""
-    console = Console() if RICH_AVAILABLE else None
+    from core.container import ContainerManager
 
     # Use current/saved config to know which runtime to use
-    saved = load_config()
-    detected = detect_system()
-    config = merge_config(detected, saved)
+    config, _, _ = _resolve_config()
 
-    _print(console, "[yellow]Stopping container...[/yellow]")
+    _print("[yellow]Stopping container...[/yellow]")
 
     manager = ContainerManager(config)
     if manager.stop():
-        _print(console, "[green]✓ Container stopped[/green]")
+        _print("[green]✓ Container stopped[/green]")
     else:
-        _print(console, "[red]✗ Failed to stop container[/red]")
+        _print("[red]✗ Failed to stop container[/red]")
         sys.exit(1)
 
 
 def run_restart(args):
     """Handle 'restart' command."""
-    console = Console() if RICH_AVAILABLE else None
+    from core.container import ContainerManager
 
-    saved = load_config()
-    detected = detect_system()
-    config = merge_config(detected, saved)
+    config, _, _ = _resolve_config()
 
-    _print(console, "[yellow]Restarting container...[/yellow]")
+    _print("[yellow]Restarting container...[/yellow]")
 
     manager = ContainerManager(config)
 
-    def output_handler(line):
-        print(line)
+    with _BufferedOutput() as out:
+        restarted = manager.restart(output_callback=out.write)
 
-    if manager.restart(output_callback=output_handler):
-        _print(console, "[green]✓ Container restarted[/green]")
+    if restarted:
+        _print("[green]✓ Container restarted[/green]")
     else:
-        _print(console, "[red]✗ Failed to restart container[/red]")
+        _print("[red]✗ Failed to restart container[/red]")
         sys.exit(1)
 
 
 def run_logs(args):
     """Handle 'logs' command."""
-    saved = load_config()
-    detected = detect_system()
-    config = merge_config(detected, saved)
+    import queue
+
+    from core.container import ContainerManager
+
+    config, _, _ = _resolve_config()
 
     manager = ContainerManager(config)
 
-    try:
-        for line in manager.logs(follow=getattr(args, "follow", False)):
-            print(line)
-    except KeyboardInterrupt:
-        pass
+    # Read the log stream on its own thread so the pipe keeps draining at line
+    # rate even when the terminal is slow to print. None marks end of stream.
+    lines = queue.SimpleQueue()
+    stop = threading.Event()
+
+    def _reader():
+        try:
+            for line in manager.logs(follow=getattr(args, "follow", False)):
+                if stop.is_set():
+                    break
+                lines.put(line)
+        finally:
+            lines.put(None)
+
+    reader = threading.Thread(target=_reader, daemon=True)
+    reader.start()
+
+    with _BufferedOutput() as out:
+        try:
+            while True:
+                line = lines.get()
+                if line is None:
+                    break
+                out.write(line)
+        except KeyboardInterrupt:
+            stop.set()
+            reader.join(timeout=1)
 
 
 def run_status(args):
     """Handle 'status' command."""
-    console = Console() if RICH_AVAILABLE else None
+    from core.container import ContainerManager
 
-    saved = load_config()
-    detected = detect_system()
-    config = merge_config(detected, saved)
+    config, _, _ = _resolve_config()
 
     manager = ContainerManager(config)
     status = manager.status()
 
     if status["running"]:
-        _print(console, "[green]✓ Container is running[/green]")
+        _print("[green]✓ Container is running[/green]")
     else:
-        _print(console, "[yellow]Container is not running[/yellow]")
+        _print("[yellow]Container is not running[/yellow]")
 
     if status.get("output"):
         print("\n" + status["output"])
@@ -264,207 +441,303 @@ def run_status(args):
 
 def run_doctor(args):
     """Handle 'doctor' command - system validation."""
-    console = Console() if RICH_AVAILABLE else None
+    from core.detector import get_detection_details
+    from core.validator import validate_system
 
-    _print(console, "[bold]Minecraft Launcher - System Check[/bold]\n")
+    _print("[bold]Minecraft Launcher - System Check[/bold]\n")
 
     # Detect system
-    detected = detect_system()
-    details = get_detection_details()
-    saved = load_config()
-    config = merge_config(detected, saved)
+    config, _, _ = _resolve_config()
+    # Reuse any probes _resolve_config() ran (none if every setting is pinned)
+    details = get_detection_details(rescan=False)
 
     # Show detection results
-    _show_doctor_detection(console, details)
+    _show_doctor_detection(details)
 
     # Validate
-    _print(console, "\n[bold]Validation:[/bold]")
-    valid, issues = validate_system(config)
+    _print("\n[bold]Validation:[/bold]")
+    valid, issues = validate_system(config, deep=True)
 
     if issues:
-        _show_validation_issues(console, issues)
+        _show_validation_issues(issues)
     else:
-        _print(console, "[green]✓ No issues found[/green]")
+        _print("[green]✓ No issues found[/green]")
 
     if valid:
-        _print(console, "\n[green bold]✓ System ready![/green bold]")
+        _print("\n[green bold]✓ System ready![/green bold]")
     else:
-        _print(console, "\n[red bold]✗ System has errors[/red bold]")
+        _print("\n[red bold]✗ System has errors[/red bold]")
         sys.exit(1)
 
 
 def run_stats(args):
     """Handle 'stats' command - show resource usage."""
-    import json
-    import subprocess
     import time
 
-    console = Console() if RICH_AVAILABLE else None
+    from core.stats import CgroupStats
+
+    console = _get_console()
 
     # Get runtime
-    saved = load_config()
-    detected = detect_system()
-    config = merge_config(detected, saved)
+    config, _, _ = _resolve_config()
     runtime = config.get("runtime", "podman")
 
-    _print(console, "[bold]Resource Usage Monitor[/bold]\n")
-    _print(console, "Press Ctrl+C to exit\n")
+    _print("[bold]Resource Usage Monitor[/bold]\n")
+    _print("Press Ctrl+C to exit\n")
 
+    # Read the container's cgroup counters directly when possible; only fall
+    # back to forking `<runtime> stats` on every tick when that isn't available.
+    sampler = CgroupStats.for_container(runtime)
+    if sampler:
+        # Give the first CPU reading a real interval to measure over
+        time.sleep(0.5)
+
+    # With rich, redraw the table in place rather than clearing the screen
+    live = None
     try:
         while True:
-            # Get container stats
-            result = subprocess.run(
-                [
-                    runtime,
-                    "stats",
-                    "--no-stream",
-                    "--format",
-                    "json" if runtime == "podman" else "table",
-                    "tlauncher",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=3,
-            )
+            if sampler:
+                rows, raw = _cgroup_stats_rows(sampler), None
+            else:
+                rows, raw = _runtime_stats_rows(runtime)
 
-            if result.returncode != 0 or not result.stdout.strip():
-                _print(console, "[yellow]Container not running[/yellow]")
+            if rows is None:
+                _print("[yellow]Container not running[/yellow]")
                 return
 
-            # Parse stats
-            if RICH_AVAILABLE:
+            # GPU stats (NVIDIA only)
+            if config.get("gpu") == "nvidia":
+                gpu_util = _nvidia_gpu_utilization()
+                if gpu_util:
+                    rows.append(("GPU", f"{gpu_util}%"))
+
+            if console:
+                from rich.table import Table
+
                 table = Table(title="Container Resources")
                 table.add_column("Metric", style="cyan")
                 table.add_column("Value", style="green")
+                for row in rows:
+                    table.add_row(*row)
+                if live is None:
+                    from rich.live import Live
 
-                if runtime == "podman":
-                    stats_list = json.loads(result.stdout.strip())
-                    stats = stats_list[0] if isinstance(stats_list, list) else stats_list
-
-                    table.add_row("CPU", stats.get("cpu_percent", "--"))
-                    table.add_row("Memory", stats.get("mem_usage", "--").split("/")[0].strip())
-                    table.add_row("Network In", stats.get("net_io", "--").split("/")[0].strip())
-                    table.add_row(
-                        "Network Out",
-                        stats.get("net_io", "--").split("/")[1].strip()
-                        if "/" in stats.get("net_io", "")
-                        else "--",
-                    )
+                    live = Live(table, console=console, auto_refresh=False)
+                    live.start(refresh=True)
                 else:
-                    # Docker table format
-                    lines = result.stdout.strip().split("\n")
-                    data_line = lines[-1] if lines else ""
-                    import re
-
-                    parts = re.split(r"\s{2,}", data_line.strip())
-
-                    if len(parts) >= 6:
-                        table.add_row("CPU", parts[2])
-                        table.add_row("Memory", parts[3].split("/")[0].strip())
-                        table.add_row(
-                            "Network In",
-                            parts[5].split("/")[0].strip() if "/" in parts[5] else "--",
-                        )
-                        table.add_row(
-                            "Network Out",
-                            parts[5].split("/")[1].strip() if "/" in parts[5] else "--",
-                        )
-
-                # GPU stats (NVIDIA only)
-                if config.get("gpu") == "nvidia":
-                    try:
-                        gpu_result = subprocess.run(
-                            [
-                                "nvidia-smi",
-                                "--query-gpu=utilization.gpu",
-                                "--format=csv,noheader,nounits",
-                            ],
-                            capture_output=True,
-                            text=True,
-                            timeout=1,
-                        )
-                        if gpu_result.returncode == 0:
-                            table.add_row("GPU", f"{gpu_result.stdout.strip()}%")
-                    except FileNotFoundError:
-                        pass
-
-                console.print(table)
-            else:
+                    live.update(table, refresh=True)
+            elif raw is not None:
                 # Plain text output
-                print(result.stdout)
+                print(raw)
+            else:
+                print("\n".join(f"  {metric}: {value}" for metric, value in rows))
 
             # One-shot mode if not in interactive terminal
             if not sys.stdout.isatty():
                 break
 
             time.sleep(2)
-            if RICH_AVAILABLE:
-                console.clear()
 
     except KeyboardInterrupt:
-        _print(console, "\n[yellow]Stopped monitoring[/yellow]")
+        _print("\n[yellow]Stopped monitoring[/yellow]")
+    finally:
+        if live:
+            live.stop()
+        if sampler:
+            sampler.close()
+
+
+def _cgroup_stats_rows(sampler):
+    """Return (metric, value) rows from a cgroup sample, or None if the container is gone."""
+    from core.stats import format_bytes
+
+    sample = sampler.sample()
+    if sample is None:
+        return None
+
+    def _net(value):
+        return "--" if value is None else format_bytes(value)
+
+    return [
+        ("CPU", f"{sample['cpu_percent']:.2f}%"),
+        ("Memory", format_bytes(sample["mem_usage"])),
+        ("Network In", _net(sample["net_rx"])),
+        ("Network Out", _net(sample["net_tx"])),
+    ]
+
+
+def _runtime_stats_rows(runtime: str):
+    """
+    Fallback: fork `<runtime> stats --no-stream` and parse its output.
+
+    Returns:
+        tuple: (rows, raw_output), or (None, None) if the container isn't running.
+            raw_output is podman's JSON; docker's is None (its templated
+            output isn't meant for reading, so plain mode prints the rows)
+    """
+    import subprocess
+
+    from core.stats import DOCKER_STATS_FORMAT
+
+    result = subprocess.run(
+        [
+            runtime,
+            "stats",
+            "--no-stream",
+            "--format",
+            "json" if runtime == "podman" else DOCKER_STATS_FORMAT,
+            "tlauncher",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=3,
+    )
+
+    if result.returncode != 0 or not result.stdout.strip():
+        return None, None
+
+    rows = []
+    if runtime == "podman":
+        stats_list = _json_loads(result.stdout.strip())
+        stats = stats_list[0] if isinstance(stats_list, list) else stats_list
+
+        net_in, _, net_out = stats.get("net_io", "--").partition("/")
+        rows.append(("CPU", stats.get("cpu_percent", "--")))
+        rows.append(("Memory", stats.get("mem_usage", "--").partition("/")[0].strip()))
+        rows.append(("Network In", net_in.strip()))
+        rows.append(("Network Out", net_out.strip() or "--"))
+    else:
+        # Docker: "cpu|mem usage / limit|net in / net out"
+        parts = result.stdout.strip().split("|")
+
+        if len(parts) == 3:
+            cpu, mem, net = parts
+            net_in, _, net_out = net.partition("/")
+            rows.append(("CPU", cpu))
+            rows.append(("Memory", mem.partition("/")[0].strip()))
+            rows.append(("Network In", net_in.strip() if net_out else "--"))
+            rows.append(("Network Out", net_out.strip() or "--"))
+
+    return rows, result.stdout if runtime == "podman" else None
+
+
+def _nvidia_gpu_utilization() -> str:
+    """Return NVIDIA GPU utilization percent as reported by nvidia-smi, or ''."""
+    import subprocess
+
+    try:
+        gpu_result = subprocess.run(
+            ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            timeout=1,
+        )
+        if gpu_result.returncode == 0:
+            return gpu_result.stdout.strip()
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    return ""
 
 
 def run_profiles(args):
     """Handle 'profiles' command - profile management."""
 
-    console = Console() if RICH_AVAILABLE else None
-
     action = args.profile_action
     profile_arg = args.profile_arg
 
     if not action or action == "list":
         # List all profiles
-        _profiles_list(console)
+        _profiles_list()
     elif action == "export":
         # Export profile
         if not profile_arg:
-            _print(console, "[red]Error: Profile name required[/red]")
-            _print(console, "Usage: profiles export <profile-name>")
+            _print("[red]Error: Profile name required[/red]")
+            _print("Usage: profiles export <profile-name>")
             sys.exit(1)
-        _profiles_export(console, profile_arg)
+        _profiles_export(profile_arg)
     elif action == "import":
         # Import profile
         if not profile_arg:
-            _print(console, "[red]Error: ZIP file path required[/red]")
-            _print(console, "Usage: profiles import <file.zip>")
+            _print("[red]Error: ZIP file path required[/red]")
+            _print("Usage: profiles import <file.zip>")
             sys.exit(1)
-        _profiles_import(console, profile_arg)
+        _profiles_import(profile_arg)
     elif action == "delete":
         # Delete profile
         if not profile_arg:
-            _print(console, "[red]Error: Profile name required[/red]")
-            _print(console, "Usage: profiles delete <profile-name>")
+            _print("[red]Error: Profile name required[/red]")
+            _print("Usage: profiles delete <profile-name>")
             sys.exit(1)
-        _profiles_delete(console, profile_arg)
+        _profiles_delete(profile_arg)
     else:
-        _print(console, f"[red]Unknown profile action: {action}[/red]")
-        _print(console, "Available actions: list, export, import, delete")
+        _print(f"[red]Unknown profile action: {action}[/red]")
+        _print("Available actions: list, export, import, delete")
         sys.exit(1)
 
 
-def _profiles_list(console):
-    """List all Minecraft profiles."""
+def _load_profiles() -> Tuple[Dict, Dict[str, str]]:
+    """
+    Read launcher_profiles.json and index its profiles by display name.
+
+    Returns:
+        tuple: (data, by_name) where by_name maps profile name -> profile ID
+    """
+    data = _read_profiles_file()
+
+    by_name = {}
+    for pid, pdata in data.get("profiles", {}).items():
+        # First profile wins when names collide, matching a linear scan
+        by_name.setdefault(pdata.get("name", pid), pid)
+
+    return data, by_name
+
+
+def _read_profiles_file() -> Dict:
+    """Parse launcher_profiles.json from raw bytes."""
+    return _json_loads(_PROFILES_FILE.read_bytes())
+
+
+def _json_loads(raw):
+    """Parse JSON text or bytes, with orjson when available."""
+    orjson = _get_orjson()
+    if orjson:
+        return orjson.loads(raw)
+
     import json
-    from pathlib import Path
 
-    profiles_file = Path(__file__).parent / "home" / "launcher_profiles.json"
+    return json.loads(raw)
 
-    if not profiles_file.exists():
-        _print(console, "[yellow]No profiles found[/yellow]")
-        return
 
-    with open(profiles_file) as f:
-        data = json.load(f)
+def _write_profiles_file(data: Dict):
+    """Write launcher_profiles.json (2-space indented), with orjson when available."""
+    orjson = _get_orjson()
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        import json
+
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    _PROFILES_FILE.write_bytes(payload)
+
 
+def _profiles_list():
+    """List all Minecraft profiles."""
+    if not _PROFILES_FILE.exists():
+        _print("[yellow]No profiles found[/yellow]")
+        return
+
+    data, _ = _load_profiles()
     profiles = data.get("profiles", {})
     if not profiles:
-        _print(console, "[yellow]No profiles found[/yellow]")
+        _print("[yellow]No profiles found[/yellow]")
         return
 
-    _print(console, "[bold]Minecraft Profiles:[/bold]\n")
+    _print("[bold]Minecraft Profiles:[/bold]\n")
+
+    console = _get_console()
+    if console:
+        from rich.table import Table
 
-    if RICH_AVAILABLE:
         table = Table()
         table.add_column("Name", style="cyan")
         table.add_column("Version", style="green")
@@ -493,36 +766,26 @@ def _profiles_list(console):
             print(f"  {name} (v{version}) [{profile_type}]{is_selected}")
 
 
-def _profiles_export(console, profile_name: str):
+def _profiles_export(profile_name: str):
     """Export profile to ZIP file."""
+    import io
     import json
     import zipfile
-    from pathlib import Path
 
-    profiles_file = Path(__file__).parent / "home" / "launcher_profiles.json"
-
-    if not profiles_file.exists():
-        _print(console, "[red]Error: No profiles found[/red]")
+    if not _PROFILES_FILE.exists():
+        _print("[red]Error: No profiles found[/red]")
         sys.exit(1)
 
-    with open(profiles_file) as f:
-        data = json.load(f)
-
+    data, by_name = _load_profiles()
     profiles = data.get("profiles", {})
 
-    # Find profile by name
-    profile_id = None
-    profile_data = None
-
-    for pid, pdata in profiles.items():
-        if pdata.get("name") == profile_name or pid == profile_name:
-            profile_id = pid
-            profile_data = pdata
-            break
+    # Find profile by name, falling back to its ID
+    profile_id = by_name.get(profile_name, profile_name if profile_name in profiles else None)
+    profile_data = profiles.get(profile_id) if profile_id else None
 
     if not profile_data:
-        _print(console, f"[red]Error: Profile '{profile_name}' not found[/red]")
-        _print(console, "Available profiles:")
+        _print(f"[red]Error: Profile '{profile_name}' not found[/red]")
+        _print("Available profiles:")
         for pid, pdata in profiles.items():
             print(f"  - {pdata.get('name', pid)}")
         sys.exit(1)
@@ -530,7 +793,7 @@ def _profiles_export(console, profile_name: str):
     version_id = profile_data.get("lastVersionId", "unknown")
     output_file = f"{profile_name}_{version_id}.mcprofile.zip"
 
-    _print(console, f"[yellow]Exporting profile: {profile_name}[/yellow]")
+    _print(f"[yellow]Exporting profile: {profile_name}[/yellow]")
 
     # Create ZIP file
     with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zipf:
@@ -541,24 +804,34 @@ def _profiles_export(console, profile_name: str):
             "version_id": version_id,
             "export_version": "1.0",
         }
-        zipf.writestr("profile_metadata.json", json.dumps(metadata, indent=2))
+        # Serialize straight into the member instead of building the string first
+        with zipf.open("profile_metadata.json", "w") as member, io.TextIOWrapper(
+            member, encoding="utf-8"
+        ) as text:
+            json.dump(metadata, text, indent=2)
 
         # Add version files
-        version_dir = Path(__file__).parent / "home" / "versions" / version_id
+        version_dir = _VERSIONS_DIR / version_id
         if version_dir.exists():
             for file_path in version_dir.rglob("*"):
                 if file_path.is_file():
                     arcname = f"version/{file_path.relative_to(version_dir)}"
-                    zipf.write(file_path, arcname)
+                    # Jars, archives, PNGs and Ogg audio are already compressed;
+                    # deflating them again burns CPU for no size gain
+                    compress_type = (
+                        zipfile.ZIP_STORED
+                        if file_path.suffix.lower() in _PRECOMPRESSED_SUFFIXES
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zipf.write(file_path, arcname, compress_type=compress_type)
 
-    _print(console, f"[green]✓ Exported to: {output_file}[/green]")
+    _print(f"[green]✓ Exported to: {output_file}[/green]")
 
 
-def _profiles_import(console, zip_path: str):
+def _profiles_import(zip_path: str):
     """Import profile from a ZIP file or an http(s) URL."""
     import json
     import zipfile
-    from pathlib import Path
 
     # If given a URL, download to a temp file first, then import that.
     tmp_to_clean = None
@@ -567,30 +840,30 @@ def _profiles_import(console, zip_path: str):
         import tempfile
         import urllib.request
 
-        _print(console, f"[yellow]Downloading profile from: {zip_path}[/yellow]")
+        _print(f"[yellow]Downloading profile from: {zip_path}[/yellow]")
         fd, tmp_path = tempfile.mkstemp(prefix="mcprofile_", suffix=".zip")
         os.close(fd)
         try:
             urllib.request.urlretrieve(zip_path, tmp_path)  # noqa: S310 (validated http(s))
         except Exception as e:
             Path(tmp_path).unlink()
-            _print(console, f"[red]Error: download failed: {e}[/red]")
+            _print(f"[red]Error: download failed: {e}[/red]")
             sys.exit(1)
         zip_path = tmp_path
         tmp_to_clean = tmp_path
 
     zip_file = Path(zip_path)
     if not zip_file.exists():
-        _print(console, f"[red]Error: File not found: {zip_path}[/red]")
+        _print(f"[red]Error: File not found: {zip_path}[/red]")
         sys.exit(1)
 
     label = "downloaded archive" if tmp_to_clean else zip_file.name
-    _print(console, f"[yellow]Importing profile from: {label}[/yellow]")
+    _print(f"[yellow]Importing profile from: {label}[/yellow]")
 
     with zipfile.ZipFile(zip_file, "r") as zipf:
         # Read metadata
         if "profile_metadata.json" not in zipf.namelist():
-            _print(console, "[red]Error: Invalid profile archive (missing metadata)[/red]")
+            _print("[red]Error: Invalid profile archive (missing metadata)[/red]")
             sys.exit(1)
 
         metadata_content = zipf.read("profile_metadata.json").decode("utf-8")
@@ -600,27 +873,25 @@ def _profiles_import(console, zip_path: str):
         version_id = metadata.get("version_id", "unknown")
         profile_name = profile_data.get("name", "Imported Profile")
 
-        _print(console, f"  Profile: {profile_name}")
-        _print(console, f"  Version: {version_id}")
+        _print(f"  Profile: {profile_name}")
+        _print(f"  Version: {version_id}")
 
         # Extract version files
-        version_dir = Path(__file__).parent / "home" / "versions" / version_id
+        version_dir = _VERSIONS_DIR / version_id
         version_dir.mkdir(parents=True, exist_ok=True)
 
-        for item in zipf.namelist():
-            if item.startswith("version/"):
-                target_path = version_dir / item.replace("version/", "")
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with zipf.open(item) as source, open(target_path, "wb") as target:
-                    target.write(source.read())
+        # Strip the "version/" prefix in place and let extractall() do the
+        # copying; it also sanitizes member paths so they can't escape version_dir
+        members = []
+        for info in zipf.infolist():
+            if info.filename.startswith("version/") and info.filename != "version/":
+                info.filename = info.filename[len("version/") :]
+                members.append(info)
+        zipf.extractall(version_dir, members)
 
         # Update launcher_profiles.json
-        profiles_file = Path(__file__).parent / "home" / "launcher_profiles.json"
-
-        if profiles_file.exists():
-            with open(profiles_file) as f:
-                launcher_data = json.load(f)
+        if _PROFILES_FILE.exists():
+            launcher_data = _read_profiles_file()
         else:
             launcher_data = {"clientToken": "imported", "profiles": {}}
 
@@ -647,62 +918,48 @@ def _profiles_import(console, zip_path: str):
         launcher_data.setdefault("profiles", {})[profile_id] = new_profile
 
         # Save
-        with open(profiles_file, "w") as f:
-            json.dump(launcher_data, f, indent=2)
+        _write_profiles_file(launcher_data)
 
     if tmp_to_clean:
-        from pathlib import Path as _Path
-
-        cleanup = _Path(tmp_to_clean)
+        cleanup = Path(tmp_to_clean)
         if cleanup.exists():
             cleanup.unlink()
 
-    _print(console, f"[green]✓ Profile '{profile_name}' imported successfully![/green]")
+    _print(f"[green]✓ Profile '{profile_name}' imported successfully![/green]")
 
 
-def _profiles_delete(console, profile_name: str):
+def _profiles_delete(profile_name: str):
     """Delete a profile."""
-    import json
-    from pathlib import Path
-
-    profiles_file = Path(__file__).parent / "home" / "launcher_profiles.json"
 
-    if not profiles_file.exists():
-        _print(console, "[red]Error: No profiles found[/red]")
+    if not _PROFILES_FILE.exists():
+        _print("[red]Error: No profiles found[/red]")
         sys.exit(1)
 
-    with open(profiles_file) as f:
-        data = json.load(f)
-
+    data, by_name = _load_profiles()
     profiles = data.get("profiles", {})
 
-    # Find profile by name
-    profile_id = None
-    profile_data = None
-
-    for pid, pdata in profiles.items():
-        if pdata.get("name") == profile_name or pid == profile_name:
-            profile_id = pid
-            profile_data = pdata
-            break
+    # Find profile by name, falling back to its ID
+    profile_id = by_name.get(profile_name, profile_name if profile_name in profiles else None)
+    profile_data = profiles.get(profile_id) if profile_id else None
 
     if not profile_data:
-        _print(console, f"[red]Error: Profile '{profile_name}' not found[/red]")
+        _print(f"[red]Error: Profile '{profile_name}' not found[/red]")
         sys.exit(1)
 
     # Confirm deletion
-    _print(console, f"[yellow]Delete profile '{profile_name}'?[/yellow]")
-    _print(console, "[dim]This will remove the profile entry from TLauncher.[/dim]")
-    _print(console, "[dim]Version files will NOT be deleted.[/dim]")
+    _print(f"[yellow]Delete profile '{profile_name}'?[/yellow]")
+    _print("[dim]This will remove the profile entry from TLauncher.[/dim]")
+    _print("[dim]Version files will NOT be deleted.[/dim]")
 
-    if QUESTIONARY_AVAILABLE:
+    questionary = _get_questionary()
+    if questionary:
         confirmed = questionary.confirm("Proceed?", default=False).ask()
     else:
         response = input("\nProceed? [y/N] ")
         confirmed = response.lower() in ["y", "yes"]
 
     if not confirmed:
-        _print(console, "Cancelled")
+        _print("Cancelled")
         return
 
     # Remove from profiles
@@ -716,67 +973,74 @@ def _profiles_delete(console, profile_name: str):
             data["selectedProfile"] = None
 
     # Save
-    with open(profiles_file, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_profiles_file(data)
 
-    _print(console, f"[green]✓ Profile '{profile_name}' deleted[/green]")
+    _print(f"[green]✓ Profile '{profile_name}' deleted[/green]")
 
 
-def _show_configuration(console, config: Dict, detected: Dict, saved: Dict):
+def _show_configuration(config: Dict, detected: Dict, saved: Dict):
     """Display configuration table."""
-    if not RICH_AVAILABLE:
+    rows = [
+        (
+            key.capitalize(),
+            config[key],
+            "saved" if saved.get(key) and saved[key] == config[key] else "detected",
+        )
+        for key in _CONFIG_KEYS
+    ]
+
+    console = _get_console()
+    if not console:
         print("\nConfiguration:")
-        for key, value in config.items():
-            if key == "auto_xhost":
-                continue
-            source = " (saved)" if saved.get(key) else " (detected)"
-            print(f"  {key.capitalize()}: {value}{source}")
+        for setting, value, source in rows:
+            print(f"  {setting}: {value} ({source})")
         return
 
+    from rich.table import Table
+
     table = Table(title="System Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
     table.add_column("Source", style="dim")
 
-    for key in ["runtime", "gpu", "display", "audio"]:
-        value = config[key]
-        source = "saved" if saved.get(key) and saved[key] == value else "detected"
-        table.add_row(key.capitalize(), value, source)
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
 
-def _show_validation_issues(console, issues):
+@_print_batch()
+def _show_validation_issues(issues):
     """Display validation issues."""
     for issue in issues:
         symbol = "✗" if issue.is_blocking() else "⚠"
         color = "red" if issue.is_blocking() else "yellow"
 
-        _print(console, f"[{color}]{symbol} {issue.message}[/{color}]")
+        _print(f"[{color}]{symbol} {issue.message}[/{color}]")
 
         if issue.fix_hint:
-            _print(console, f"  [dim]→ {issue.fix_hint}[/dim]")
+            _print(f"  [dim]→ {issue.fix_hint}[/dim]")
 
 
-def _show_doctor_detection(console, details: Dict):
+@_print_batch()
+def _show_doctor_detection(details: Dict):
     """Show detailed detection results for doctor command."""
-    _print(console, "[bold]Detection Results:[/bold]")
+    _print("[bold]Detection Results:[/bold]")
 
     # Runtime
     rt = details["runtime"]
     status = "✓" if rt["available"] else "✗"
-    _print(console, f"{status} Runtime: {rt['value']} ({rt['path']})")
+    _print(f"{status} Runtime: {rt['value']} ({rt['path']})")
 
     # GPU
     gpu = details["gpu"]
     status = "✓" if gpu["devices_exist"] else "⚠"
-    _print(console, f"{status} GPU: {gpu['details']}")
+    _print(f"{status} GPU: {gpu['details']}")
 
     # Display
     disp = details["display"]
     resolution = disp.get("resolution") or "unknown"
     _print(
-        console,
         f"✓ Display: {disp['value']} ({resolution}, session: {disp['session_type']}, "
         f"var: {disp['display_var']})",
     )
@@ -784,52 +1048,69 @@ def _show_doctor_detection(console, details: Dict):
     # Audio
     aud = details["audio"]
     audio_status = "✓" if aud["value"] != "none" else "⚠"
-    _print(console, f"{audio_status} Audio: {aud['details']}")
+    _print(f"{audio_status} Audio: {aud['details']}")
 
     # Host display scale (informational only - not auto-applied; TLauncher
     # ignores Java2D scaling. Export JAVA_UI_SCALE to force it.)
     scale = details["ui_scale"]["value"]
     if scale > 1.0:
-        _print(console, f"  Host scale: {scale:g}x (not applied; export JAVA_UI_SCALE to force)")
+        _print(f"  Host scale: {scale:g}x (not applied; export JAVA_UI_SCALE to force)")
     else:
-        _print(console, "  Host scale: 1x")
+        _print("  Host scale: 1x")
 
 
-def _confirm_start(console, config: Dict) -> bool:
+def _confirm_start(config: Dict) -> bool:
     """Ask user to confirm start."""
-    if QUESTIONARY_AVAILABLE:
+    questionary = _get_questionary()
+    if questionary:
         return questionary.confirm("Start Minecraft with these settings?", default=True).ask()
-    # Fallback to simple input
-    response = input("\nStart Minecraft with these settings? [Y/n] ")
-    return response.lower() in ["", "y", "yes"]
+    # Fallback to a plain stdin read (input() would initialize GNU readline)
+    sys.stdout.write("\nStart Minecraft with these settings? [Y/n] ")
+    sys.stdout.flush()
+    response = sys.stdin.readline()
+    if not response:
+        # EOF (closed/non-interactive stdin): don't start without a real answer
+        return False
+    return response.strip().lower() in ["", "y", "yes"]
 
 
-def _show_log_findings(console, lines):
+@_print_batch()
+def _show_log_findings(lines):
     """Analyze log lines and print findings if any."""
+    from core.log_analyzer import analyze_lines
+
     findings = analyze_lines(lines)
     if not findings:
         return
 
-    _print(console, "\n[bold]Log Analysis:[/bold]")
-    _print(console, "─" * 50)
+    _print("\n[bold]Log Analysis:[/bold]")
+    _print("─" * 50)
 
     for finding in findings:
         color = "red" if finding.level == "error" else "yellow"
         symbol = "✗" if finding.level == "error" else "⚠"
-        _print(console, f"[{color}]{symbol} {finding.title}[/{color}]")
-        _print(console, f"  [dim]{finding.detail}[/dim]")
+        _print(f"[{color}]{symbol} {finding.title}[/{color}]")
+        _print(f"  [dim]{finding.detail}[/dim]")
         for rec_line in finding.recommendation.splitlines():
-            _print(console, f"  [cyan]→ {rec_line}[/cyan]")
-        _print(console, "")
+            _print(f"  [cyan]→ {rec_line}[/cyan]")
+        _print("")
 
 
-def _print(console, text: str):
+def _print(text: str):
     """Print with rich if available, plain otherwise."""
+    if _print_buffer is not None:
+        _print_buffer.append(text)
+    else:
+        _emit(text)
+
+
+def _emit(text: str):
+    """Write text to the terminal, rendering or stripping rich markup."""
+    console = _get_console()
     if console:
         console.print(text)
-    else:
+    elif "[" in text:
         # Strip rich markup for plain printing
-        import re
-
-        plain_text = re.sub(r"\[.*?\]", "", text)
-        print(plain_text)
+        print(_MARKUP_RE.sub("", text))
+    else:
+        print(text)
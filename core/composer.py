@@ -3,12 +3,20 @@ Compose command builder for Minecraft Launcher.
 Constructs docker/podman compose commands with appropriate file combinations.
 """
 
+import functools
 import os
+import shlex
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 
 from .detector import detect_compose_provider
 
+# Compose files live in the repository root: core/composer.py -> core/ -> parent
+_COMPOSE_DIR = Path(__file__).parent.parent
+
+# Directory listing of _COMPOSE_DIR, keyed by the directory's mtime
+_compose_files_cache: Dict[int, Set[str]] = {}
+
 
 def build_compose_env(config: Dict[str, str]) -> Dict[str, str]:
     """
@@ -66,27 +74,46 @@ def build_compose_command(
     Returns:
         list: Complete command as list of strings
     """
-    # Get the directory where compose files are located
-    compose_dir = get_compose_directory()
+    return [*_compose_prefix(*_config_key(config)), action, *(extra_args or ())]
+
+
+def build_compose_prefix(config: Dict[str, str]) -> List[str]:
+    """
+    Build the configuration-dependent part of a compose command.
+
+    Args:
+        config: Configuration dict with runtime, gpu, display, audio
+
+    Returns:
+        list: Runtime, 'compose' and the -f options; append an action and its args
+    """
+    # Return a fresh list so callers can't mutate the cached prefix
+    return list(_compose_prefix(*_config_key(config)))
 
-    # Build list of compose files in correct order
-    files = get_compose_files(config)
+
+def _config_key(config: Dict[str, str]) -> Tuple[str, str, str, str]:
+    """Return the (runtime, gpu, display, audio) values that select compose files."""
+    return (
+        config["runtime"],
+        config.get("gpu", ""),
+        config.get("display", ""),
+        config.get("audio", ""),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compose_prefix(runtime: str, gpu: str, display: str, audio: str) -> Tuple[str, ...]:
+    """Build (and memoize) '<runtime> compose -f ...' for one configuration."""
+    files = get_compose_files({"runtime": runtime, "gpu": gpu, "display": display, "audio": audio})
 
     # Start building command
-    cmd = [config["runtime"], "compose"]
+    cmd = [runtime, "compose"]
 
     # Add compose files
     for f in files:
-        cmd.extend(["-f", str(compose_dir / f)])
+        cmd.extend(["-f", str(_COMPOSE_DIR / f)])
 
-    # Add action
-    cmd.append(action)
-
-    # Add extra arguments if provided
-    if extra_args:
-        cmd.extend(extra_args)
-
-    return cmd
+    return tuple(cmd)
 
 
 def get_compose_directory() -> Path:
@@ -96,9 +123,7 @@ def get_compose_directory() -> Path:
     Returns:
         Path: Directory path
     """
-    # Assume compose files are in the same directory as this script's parent
-    # core/composer.py -> core/ -> parent directory
-    return Path(__file__).parent.parent
+    return _COMPOSE_DIR
 
 
 def get_compose_files(config: Dict[str, str]) -> List[str]:
@@ -140,17 +165,27 @@ def validate_compose_files_exist(config: Dict[str, str]) -> tuple[bool, List[str
     Returns:
         tuple: (all_exist, missing_files)
     """
-    compose_dir = get_compose_directory()
-    files = get_compose_files(config)
-    missing = []
-
-    for f in files:
-        if not (compose_dir / f).exists():
-            missing.append(f)
+    available = _compose_file_names()
+    missing = [f for f in get_compose_files(config) if f not in available]
 
     return len(missing) == 0, missing
 
 
+def _compose_file_names() -> Set[str]:
+    """Return the names of files in the compose directory, re-listing it only when it changes."""
+    try:
+        mtime = _COMPOSE_DIR.stat().st_mtime_ns
+    except OSError:
+        return set()
+    names = _compose_files_cache.get(mtime)
+    if names is None:
+        with os.scandir(_COMPOSE_DIR) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+        _compose_files_cache.clear()
+        _compose_files_cache[mtime] = names
+    return names
+
+
 def get_command_preview(config: Dict[str, str], action: str = "up") -> str:
     """
     Get human-readable preview of the command that will be run.
@@ -162,5 +197,11 @@ def get_command_preview(config: Dict[str, str], action: str = "up") -> str:
     Returns:
         str: Command preview
     """
-    cmd = build_compose_command(config, action)
-    return " ".join(cmd)
+    return _command_preview(*_config_key(config), action)
+
+
+@functools.lru_cache(maxsize=32)
+def _command_preview(runtime: str, gpu: str, display: str, audio: str, action: str) -> str:
+    """Quote (and memoize) the command line for one configuration and action."""
+    cmd = [*_compose_prefix(runtime, gpu, display, audio), action]
+    return " ".join(shlex.quote(part) for part in cmd)
@@ -4,14 +4,18 @@ Handles loading, saving, and merging user preferences.
 """
 
 from pathlib import Path
-from typing import Dict
-
-import yaml
+from typing import Any, Dict
 
 # Configuration file location
 CONFIG_DIR = Path.home() / ".config" / "minecraft-launcher"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Last parsed config, keyed by the file's (mtime, size) so edits are picked up
+_CACHE: Dict[str, Any] = {}
+
+# Settings where a non-empty saved value overrides detection
+_MERGED_KEYS = ("runtime", "gpu", "display", "audio")
+
 
 def load_config() -> Dict[str, str]:
     """
@@ -20,20 +24,34 @@ def load_config() -> Dict[str, str]:
     Returns:
         dict: Saved configuration, or empty dict if file doesn't exist
     """
-    if not CONFIG_FILE.exists():
-        return {}
-
     try:
-        with open(CONFIG_FILE) as f:
-            config = yaml.safe_load(f) or {}
-            # Ensure all expected keys exist with empty string defaults
-            return {
-                "runtime": config.get("runtime", ""),
-                "gpu": config.get("gpu", ""),
-                "display": config.get("display", ""),
-                "audio": config.get("audio", ""),
-                "auto_xhost": config.get("auto_xhost", True),
-            }
+        stat = CONFIG_FILE.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if _CACHE.get("stamp") == stamp:
+            return dict(_CACHE["config"])
+
+        # PyYAML is imported lazily: startup paths without a config file never
+        # pay for it. Prefer the libyaml-backed loader when it was compiled in.
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        # One read of the whole (small) file; parsing the bytes directly avoids
+        # PyYAML's incremental stream reader.
+        config = yaml.load(CONFIG_FILE.read_bytes(), Loader=loader) or {}
+        # Ensure all expected keys exist with empty string defaults
+        loaded = {
+            "runtime": config.get("runtime", ""),
+            "gpu": config.get("gpu", ""),
+            "display": config.get("display", ""),
+            "audio": config.get("audio", ""),
+            "auto_xhost": config.get("auto_xhost", True),
+        }
+        _CACHE["stamp"] = stamp
+        _CACHE["config"] = loaded
+        return dict(loaded)
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         print(f"Warning: Could not load config file: {e}")
         return {}
@@ -62,9 +80,13 @@ def save_config(config: Dict[str, any]) -> bool:
             "auto_xhost": config.get("auto_xhost", True),
         }
 
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         with open(CONFIG_FILE, "w") as f:
-            yaml.dump(save_data, f, default_flow_style=False)
+            yaml.dump(save_data, f, Dumper=dumper, default_flow_style=False)
 
+        _CACHE.clear()
         return True
     except Exception as e:
         print(f"Error: Could not save config file: {e}")
@@ -83,12 +105,12 @@ def merge_config(detected: Dict[str, str], saved: Dict[str, str]) -> Dict[str, s
     Returns:
         dict: Merged configuration
     """
-    merged = detected.copy()
+    merged = dict(detected)
 
     # Override with saved config if value is not empty
-    for key in ["runtime", "gpu", "display", "audio"]:
-        saved_value = saved.get(key, "")
-        if saved_value and saved_value.strip():
+    for key in _MERGED_KEYS:
+        saved_value = saved.get(key)
+        if saved_value and (not isinstance(saved_value, str) or saved_value.strip()):
             merged[key] = saved_value
 
     # Add auto_xhost setting
@@ -127,6 +149,7 @@ def reset_config() -> bool:
     try:
         if CONFIG_FILE.exists():
             CONFIG_FILE.unlink()
+        _CACHE.clear()
         return True
     except Exception as e:
         print(f"Error: Could not delete config file: {e}")
@@ -3,12 +3,18 @@ Container management module for Minecraft Launcher.
 Handles starting, stopping, and monitoring containers.
 """
 
+import contextlib
+import json
+import os
+import re
+import selectors
+import signal
 import subprocess
 import threading
 import time
-from typing import Callable, Dict, Iterator, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
-from .composer import build_compose_command, build_compose_env
+from .composer import build_compose_env, build_compose_prefix
 
 IMAGE_NAME = "tlauncher-java"
 CONTAINER_NAME = "tlauncher"
@@ -18,7 +24,10 @@ def image_exists(runtime: str, image: str = IMAGE_NAME) -> bool:
     """Return True if the container image is present locally."""
     try:
         result = subprocess.run(
-            [runtime, "image", "inspect", image], capture_output=True, timeout=15
+            [runtime, "image", "inspect", image],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=15,
         )
         return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
@@ -36,11 +45,36 @@ class ContainerManager:
             config: Configuration dict with runtime, gpu, display, audio
         """
         self.config = config
+        self._cmd_prefix = build_compose_prefix(config)
+        self._env: Optional[Dict[str, str]] = None
         self.process: Optional[subprocess.Popen] = None
         self._stop_requested = False
+        self._status_cache: Optional[Dict[str, any]] = None
+        self._status_ts = 0.0
+
+    def config_changed(self):
+        """Rebuild the cached compose command prefix and environment after editing self.config."""
+        self._cmd_prefix = build_compose_prefix(self.config)
+        self._env = None
+        self._invalidate_status()
+
+    def _compose_command(self, action: str, extra_args: List[str] = None) -> List[str]:
+        """Return the compose command for an action, reusing the prebuilt prefix."""
+        return [*self._cmd_prefix, action, *(extra_args or ())]
+
+    def _compose_env(self) -> Dict[str, str]:
+        """Return the compose environment, built on first use and then reused."""
+        if self._env is None:
+            self._env = build_compose_env(self.config)
+        return self._env
 
     # Log line patterns that indicate TLauncher has finished loading (GUI is up)
     _STARTED_PATTERNS = ("[Loading] SUCCESS", "Started!")
+    # ...as one alternation, so each line is scanned once instead of per pattern
+    _STARTED_RE = re.compile("|".join(map(re.escape, _STARTED_PATTERNS)))
+
+    # Seconds a status() result is reused before `compose ps` is run again
+    _STATUS_TTL = 5.0
 
     def start(
         self,
@@ -48,6 +82,7 @@ class ContainerManager:
         force_recreate: bool = False,
         output_callback: Callable[[str], None] = None,
         started_callback: Callable[[], None] = None,
+        output_batch_callback: Callable[[List[str]], None] = None,
     ) -> bool:
         """
         Start the container.
@@ -57,6 +92,8 @@ class ContainerManager:
             force_recreate: Force recreate containers
             output_callback: Function to call with each line of output
             started_callback: Called once when launcher log shows startup success (GUI up)
+            output_batch_callback: Alternative to output_callback; called once per
+                                   read with every complete line it produced
 
         Returns:
             bool: True if process exited with code 0
@@ -67,22 +104,30 @@ class ContainerManager:
         if force_recreate:
             extra_args.append("--force-recreate")
 
-        cmd = build_compose_command(self.config, "up", extra_args)
-        env = build_compose_env(self.config)
+        cmd = self._compose_command("up", extra_args)
+        env = self._compose_env()
+        self._invalidate_status()
+        # A manager is reused across runs; a stop() of the previous one mustn't
+        # end this one
+        self._stop_requested = False
 
+        process = None
         try:
             if detached:
                 # For detached mode, just run and return
-                result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+                result = subprocess.run(
+                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env
+                )
                 return result.returncode == 0
-            # For interactive mode, stream output
-            self.process = subprocess.Popen(
+            # For interactive mode, stream output. The client gets its own
+            # process group so stop() can signal it (and any helpers it
+            # spawned) directly instead of depending on another compose call.
+            process = self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
                 env=env,
+                start_new_session=True,
             )
 
             # Thread-safe "started" signal shared by the stream scanner below and
@@ -104,32 +149,51 @@ class ContainerManager:
 
             if started_callback:
                 threading.Thread(
-                    target=self._poll_started, args=(env, _signal_started), daemon=True
+                    target=self._poll_started,
+                    args=(process, env, _signal_started),
+                    daemon=True,
                 ).start()
 
             # Stream output lines
-            if output_callback:
-                for line in iter(self.process.stdout.readline, ""):
-                    if line:
-                        stripped = line.rstrip()
-                        output_callback(stripped)
-                        # Signal "Running" once we see TLauncher has started
-                        if any(p in stripped for p in self._STARTED_PATTERNS):
-                            _signal_started()
+            if output_callback or output_batch_callback:
+                for lines in _iter_line_batches(
+                    process.stdout, should_stop=lambda: self._stop_requested
+                ):
+                    if output_batch_callback:
+                        output_batch_callback(lines)
+                    else:
+                        for line in lines:
+                            output_callback(line)
+                    # Signal "Running" once we see TLauncher has started
+                    if any(self._STARTED_RE.search(line) for line in lines):
+                        _signal_started()
                     if self._stop_requested:
                         break
 
             # Wait for process to complete
-            self.process.wait()
-            return self.process.returncode == 0
-
+            process.wait()
+            return process.returncode == 0
+
+        except KeyboardInterrupt:
+            # The client no longer shares our process group, so pass Ctrl+C on
+            # for compose to shut the container down as it would in a terminal
+            if process is not None:
+                _signal_process_group(process, signal.SIGINT)
+            raise
         except Exception as e:
-            if output_callback:
+            if output_batch_callback:
+                output_batch_callback([f"Error starting container: {str(e)}"])
+            elif output_callback:
                 output_callback(f"Error starting container: {str(e)}")
             return False
+        finally:
+            # Only forget our own run; a newer start() may already have replaced it
+            if process is not None and self.process is process:
+                self.process = None
 
     def _poll_started(
         self,
+        process: subprocess.Popen,
         env: Dict[str, str],
         signal_started: Callable[[], None],
         interval: float = 1.0,
@@ -146,14 +210,14 @@ class ContainerManager:
         logs_cmd = [self.config["runtime"], "logs", "--tail", "500", CONTAINER_NAME]
         elapsed = 0.0
         while elapsed < timeout and not self._stop_requested:
-            if self.process and self.process.poll() is not None:
+            if process.poll() is not None:
                 return
             try:
                 result = subprocess.run(
                     logs_cmd, capture_output=True, text=True, env=env, timeout=15
                 )
                 blob = (result.stdout or "") + (result.stderr or "")
-                if any(p in blob for p in self._STARTED_PATTERNS):
+                if self._STARTED_RE.search(blob):
                     signal_started()
                     return
             except Exception:
@@ -161,36 +225,50 @@ class ContainerManager:
             time.sleep(interval)
             elapsed += interval
 
-    def stop(self, stop_timeout: int = 5) -> bool:
+    def stop(self, stop_timeout: int = 5, fast: bool = True) -> bool:
         """
         Stop the container.
 
-        Uses compose stop -t N first so the container is killed after N seconds
-        if it doesn't respond to SIGTERM (e.g. Java/TLauncher), then down to remove.
+        A `compose up` started by this manager is signalled directly (its process
+        group gets SIGTERM, then SIGKILL after N seconds). Then compose down -t N
+        stops the container, killing it after N seconds if it doesn't respond to
+        SIGTERM (e.g. Java/TLauncher), and removes it in the same invocation.
 
         Args:
             stop_timeout: Seconds to wait for graceful stop before SIGKILL (default 5)
+            fast: Stop and remove with a single `compose down -t N`; False runs a
+                  separate `compose stop -t N` first, then `compose down`
 
         Returns:
             bool: True if stopped successfully
         """
         self._stop_requested = True
-        env = build_compose_env(self.config)
+        env = self._compose_env()
+
+        # If this manager launched an attached `compose up`, end it with
+        # bounded latency: SIGTERM its group, then SIGKILL after stop_timeout
+        process = self.process
+        if process and process.poll() is None:
+            _signal_process_group(process, signal.SIGTERM)
+            try:
+                process.wait(timeout=stop_timeout)
+            except subprocess.TimeoutExpired:
+                _signal_process_group(process, signal.SIGKILL)
 
+        timeout_args = ["-t", str(stop_timeout)]
         try:
-            # Stop with short timeout so we don't hang on unresponsive Java process
-            stop_cmd = build_compose_command(self.config, "stop", ["-t", str(stop_timeout)])
-            subprocess.run(
-                stop_cmd, capture_output=True, text=True, timeout=stop_timeout + 15, env=env
-            )
-            # Remove containers (already stopped, so this is quick)
-            down_cmd = build_compose_command(self.config, "down")
-            result = subprocess.run(down_cmd, capture_output=True, text=True, timeout=15, env=env)
-            return result.returncode == 0
-        except subprocess.TimeoutExpired:
-            return False
+            if not fast:
+                # Stop with short timeout so we don't hang on unresponsive Java process
+                stop_cmd = self._compose_command("stop", timeout_args)
+                _run_with_watchdog(stop_cmd, env, stop_timeout + 15)
+            # Remove containers; with fast=True this also does the stopping
+            down_cmd = self._compose_command("down", timeout_args if fast else None)
+            return _run_with_watchdog(down_cmd, env, stop_timeout + 15) == 0
         except Exception:
             return False
+        finally:
+            # Container state changed (or may have); don't serve a stale status
+            self._invalidate_status()
 
     def restart(self, output_callback: Callable[[str], None] = None) -> bool:
         """
@@ -232,21 +310,17 @@ class ContainerManager:
         if tail:
             extra_args.extend(["--tail", str(tail)])
 
-        cmd = build_compose_command(self.config, "logs", extra_args)
+        cmd = self._compose_command("logs", extra_args)
 
         try:
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                env=build_compose_env(self.config),
+                env=self._compose_env(),
             )
 
-            for line in iter(process.stdout.readline, ""):
-                if line:
-                    yield line.rstrip()
+            yield from _iter_lines(process.stdout)
 
         except Exception as e:
             yield f"Error reading logs: {str(e)}"
@@ -255,20 +329,37 @@ class ContainerManager:
         """
         Get container status.
 
+        Results are reused for _STATUS_TTL seconds so frequent pollers don't
+        spawn `compose ps` on every call; start() and stop() invalidate them.
+
         Returns:
             dict: Status information with keys: running, containers
         """
-        cmd = build_compose_command(self.config, "ps", ["--format", "json"])
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_ts < self._STATUS_TTL:
+            return self._status_cache
+
+        self._status_cache = self._query_status()
+        self._status_ts = now
+        return self._status_cache
+
+    def _invalidate_status(self):
+        """Drop the cached status() result so the next call queries compose."""
+        self._status_cache = None
+
+    def _query_status(self) -> Dict[str, any]:
+        """Run `compose ps` and parse whether the container is running."""
+        cmd = self._compose_command("ps", ["--format", "json"])
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=10, env=build_compose_env(self.config)
+                cmd, capture_output=True, text=True, timeout=10, env=self._compose_env()
             )
 
             if result.returncode == 0:
                 # Parse output to determine if container is running
                 output = result.stdout.strip()
-                running = bool(output and "tlauncher" in output.lower())
+                running = any(_is_running_record(record) for record in _ps_records(output))
 
                 return {"running": running, "output": output}
             return {"running": False, "error": result.stderr}
@@ -289,12 +380,129 @@ class ContainerManager:
         return status.get("running", False)
 
 
+def _ps_records(output: str) -> Iterator[dict]:
+    """
+    Yield the container records from `compose ps --format json` output.
+
+    Compose v2 prints one JSON object per line (older releases and podman
+    print a single JSON array); lines that aren't JSON are skipped.
+    """
+    if output.startswith("["):
+        try:
+            yield from json.loads(output)
+        except ValueError:
+            pass
+        return
+    for line in output.splitlines():
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def _is_running_record(record) -> bool:
+    """Return True if a ps record is the launcher container in the running state."""
+    if not isinstance(record, dict):
+        return False
+    names = record.get("Names") or record.get("Name") or ()
+    if isinstance(names, str):
+        names = (names,)
+    # The compose service and its container are both named CONTAINER_NAME
+    if record.get("Service") != CONTAINER_NAME and CONTAINER_NAME not in names:
+        return False
+    return str(record.get("State", "")).lower() == "running"
+
+
+def _run_with_watchdog(cmd: List[str], env: Dict[str, str], timeout: float) -> Optional[int]:
+    """
+    Run a command with its output discarded, killing it if it overruns.
+
+    With no pipes to drain, waiting is a plain waitpid. The command runs in its
+    own session so a timeout kills the whole group, including any runtime
+    processes compose spawned, not just the compose client.
+
+    Returns:
+        The exit code, or None if the command was killed after timeout seconds
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        start_new_session=True,
+    )
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+        return None
+
+
+def _iter_lines(stream, **kwargs) -> Iterator[str]:
+    """Yield decoded, right-stripped lines from a binary pipe (see _iter_line_batches)."""
+    for lines in _iter_line_batches(stream, **kwargs):
+        yield from lines
+
+
+def _iter_line_batches(
+    stream,
+    chunk_size: int = 65536,
+    should_stop: Optional[Callable[[], bool]] = None,
+    poll_interval: float = 0.5,
+) -> Iterator[List[str]]:
+    """
+    Yield lists of decoded, right-stripped lines from a binary pipe.
+
+    Each read returns whatever is available (up to chunk_size) and all complete
+    lines in it are yielded together, so a burst of output costs one syscall
+    and one consumer call rather than one per line, while a lone line on a
+    quiet pipe is still yielded immediately.
+
+    Args:
+        stream: Binary pipe (e.g. Popen.stdout)
+        chunk_size: Maximum bytes per read
+        should_stop: Polled every poll_interval seconds while the pipe is quiet;
+                     iteration ends as soon as it returns True
+        poll_interval: Seconds to wait for output between should_stop checks
+    """
+    fd = stream.fileno()
+    pending = b""
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            if should_stop is not None:
+                while not selector.select(poll_interval):
+                    if should_stop():
+                        return
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            if lines:
+                yield [line.decode("utf-8", "replace").rstrip() for line in lines]
+    if pending:
+        yield [pending.decode("utf-8", "replace").rstrip()]
+
+
+def _signal_process_group(process: subprocess.Popen, sig: int) -> None:
+    """Send a signal to a `compose up` client's process group."""
+    try:
+        # start_new_session=True makes the client its group leader (pgid == pid)
+        os.killpg(process.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
 def start_container_async(
     config: Dict[str, str],
     detached: bool = False,
     output_callback: Callable[[str], None] = None,
     started_callback: Callable[[], None] = None,
     completion_callback: Callable[[bool], None] = None,
+    output_batch_callback: Callable[[List[str]], None] = None,
+    manager: Optional[ContainerManager] = None,
 ):
     """
     Start container in a background thread (for GUI).
@@ -305,12 +513,19 @@ def start_container_async(
         output_callback: Function to call with output lines
         started_callback: Called once when launcher log shows startup success (GUI up)
         completion_callback: Called when the container process exits; argument is (returncode == 0)
+        output_batch_callback: Called with lists of output lines instead of one line at a time
+        manager: Manager to run the start on, so a later manager.stop() can signal
+                 the `compose up` it launched (a new one is created if None)
     """
+    if manager is None:
+        manager = ContainerManager(config)
 
     def _worker():
-        manager = ContainerManager(config)
         success = manager.start(
-            detached=detached, output_callback=output_callback, started_callback=started_callback
+            detached=detached,
+            output_callback=output_callback,
+            started_callback=started_callback,
+            output_batch_callback=output_batch_callback,
         )
         if completion_callback:
             completion_callback(success)
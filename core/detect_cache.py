@@ -0,0 +1,66 @@
+"""
+On-disk cache of system detection results for Minecraft Launcher.
+Lets repeated launches skip the lspci/pactl probes while the system is unchanged.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import time
+from pathlib import Path
+from typing import Dict
+
+from .detector import NVIDIA_CTL_DEVICE, NVIDIA_DEVICE, PULSE_SOCKET, detect_system, which
+
+CACHE_DIR = Path.home() / ".cache" / "minecraft-launcher"
+CACHE_FILE = CACHE_DIR / "detect.json"
+
+# Seconds a stored result is trusted, even while its environment key matches
+CACHE_TTL = 3600
+
+# Environment variables detect_display() looks at
+_DISPLAY_VARS = ("XDG_SESSION_TYPE", "WAYLAND_DISPLAY", "DISPLAY", "WSL_DISTRO_NAME")
+
+
+def get_cached_detection(force: bool = False) -> Dict[str, str]:
+    """
+    Return detect_system()'s result, reusing one stored by a recent launch.
+
+    Args:
+        force: Ignore the stored result and probe again
+
+    Returns:
+        dict: Configuration with keys: runtime, gpu, display, audio
+    """
+    key = _environment_key()
+    if not force:
+        try:
+            if time.time() - CACHE_FILE.stat().st_mtime < CACHE_TTL:
+                stored = json.loads(CACHE_FILE.read_bytes())
+                if stored["key"] == key:
+                    return stored["detected"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    detected = detect_system()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps({"key": key, "detected": detected}))
+    except OSError:
+        pass
+    return detected
+
+
+def _environment_key() -> str:
+    """Hash the cheap-to-read inputs detection depends on (kernel, session, devices)."""
+    parts = [platform.release()]
+    parts.extend(os.environ.get(name, "") for name in _DISPLAY_VARS)
+    parts.extend(str(path.exists()) for path in (NVIDIA_DEVICE, NVIDIA_CTL_DEVICE, PULSE_SOCKET))
+    for runtime in ("podman", "docker"):
+        path = which(runtime)
+        try:
+            parts.append(f"{path}:{Path(path).stat().st_mtime_ns}" if path else "")
+        except OSError:
+            parts.append(str(path))
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()
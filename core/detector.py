@@ -3,13 +3,21 @@ System detection module for Minecraft Launcher.
 Auto-detects container runtime, GPU type, display server, and audio system.
 """
 
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
+
+# Device nodes and sockets probed by detection and validation
+NVIDIA_DEVICE = Path("/dev/nvidia0")
+NVIDIA_CTL_DEVICE = Path("/dev/nvidiactl")
+DRI_DIR = Path("/dev/dri")
+PULSE_SOCKET = Path(f"/run/user/{os.getuid()}/pulse/native")
 
 
 def detect_system() -> Dict[str, str]:
@@ -19,14 +27,47 @@ def detect_system() -> Dict[str, str]:
     Returns:
         dict: Configuration with keys: runtime, gpu, display, audio
     """
-    return {
-        "runtime": detect_runtime(),
-        "gpu": detect_gpu(),
-        "display": detect_display(),
-        "audio": detect_audio(),
+    # The probes are independent and mostly wait on subprocesses; overlap them
+    detectors = {
+        "runtime": detect_runtime,
+        "gpu": detect_gpu,
+        "display": detect_display,
+        "audio": detect_audio,
     }
+    with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+        futures = {key: executor.submit(fn) for key, fn in detectors.items()}
+    return {key: future.result() for key, future in futures.items()}
+
+
+def invalidate_detection() -> None:
+    """
+    Forget memoized detection results so the next probe re-checks the system.
+
+    The detectors cache their answers for the process lifetime (the session's
+    environment and hardware don't change under a running launcher); call this
+    when the user explicitly asks for a rescan.
+    """
+    for cached in (detect_runtime, detect_gpu, detect_display, detect_audio, _pactl_info, _which):
+        cached.cache_clear()
+
+
+def which(name: str) -> Optional[str]:
+    """
+    Cached shutil.which() (each uncached lookup stats every $PATH directory).
+
+    Results are keyed on the current PATH, so changing PATH is picked up;
+    invalidate_detection() forgets executables installed since the last lookup.
+    """
+    # None (PATH unset) lets shutil.which() fall back to os.defpath, as before
+    return _which(name, os.environ.get("PATH"))
+
+
+@functools.lru_cache(maxsize=32)
+def _which(name: str, path: Optional[str]) -> Optional[str]:
+    return shutil.which(name, path=path)
 
 
+@functools.lru_cache(maxsize=1)
 def detect_runtime() -> str:
     """
     Detect container runtime (podman or docker).
@@ -35,13 +76,14 @@ def detect_runtime() -> str:
         str: 'podman' or 'docker'
     """
     # Prefer podman if available
-    if shutil.which("podman"):
+    if which("podman"):
         return "podman"
-    if shutil.which("docker"):
+    if which("docker"):
         return "docker"
     return "podman"  # Default, will fail validation later
 
 
+@functools.lru_cache(maxsize=1)
 def detect_gpu() -> str:
     """
     Detect GPU type (nvidia, amd, or intel).
@@ -53,7 +95,7 @@ def detect_gpu() -> str:
         str: 'nvidia', 'amd', or 'intel'
     """
     # Check for NVIDIA devices
-    if Path("/dev/nvidia0").exists() or Path("/dev/nvidiactl").exists():
+    if NVIDIA_DEVICE.exists() or NVIDIA_CTL_DEVICE.exists():
         return "nvidia"
 
     # Determine the vendor of the active GPU via lspci (works even when /dev/dri
@@ -63,30 +105,51 @@ def detect_gpu() -> str:
         return vendor
 
     # Fallback: a DRI device exists but vendor is unknown -> assume Mesa/amd path.
-    if Path("/dev/dri").exists() and list(Path("/dev/dri").glob("card*")):
+    if _has_dri_card():
         return "amd"
 
     # Default to amd (broadest Mesa compatibility)
     return "amd"
 
 
-def _lspci_gpu_vendor() -> str:
-    """Return 'nvidia', 'amd', or 'intel' from the VGA/3D controller in lspci."""
+def _has_dri_card() -> bool:
+    """Return True if /dev/dri has a card* node (stops at the first one found)."""
+    try:
+        with os.scandir(DRI_DIR) as entries:
+            return any(entry.name.startswith("card") for entry in entries)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _lspci_output() -> str:
+    """Run lspci once per process (the PCI device list doesn't change); '' on failure."""
     try:
         result = subprocess.run(["lspci"], capture_output=True, text=True, timeout=2)
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return ""
+    return result.stdout
+
+
+@functools.lru_cache(maxsize=1)
+def _pactl_info() -> str:
+    """Return `pactl info` output, or '' if no audio server answered."""
+    try:
+        result = subprocess.run(["pactl", "info"], capture_output=True, text=True, timeout=2)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
 
-    for line in result.stdout.splitlines():
-        lowered = line.lower()
-        if "vga" not in lowered and "3d controller" not in lowered and "display" not in lowered:
-            continue
-        if any(k in lowered for k in ("nvidia", "geforce", "quadro", "rtx")):
-            return "nvidia"
-        if any(k in lowered for k in ("amd", "radeon", "ati")):
-            return "amd"
-        if "intel" in lowered:
-            return "intel"
+def _lspci_gpu_vendor(lspci_out: Optional[str] = None) -> str:
+    """Return 'nvidia', 'amd', or 'intel' from the VGA/3D controller in lspci."""
+    if lspci_out is None:
+        lspci_out = _lspci_output()
+    for match in _GPU_LINE_RE.finditer(lspci_out):
+        line = match.group()
+        for vendor, vendor_re in _GPU_VENDOR_RES.items():
+            if vendor_re.search(line):
+                return vendor
     return ""
 
 
@@ -100,6 +163,7 @@ def is_wsl() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def detect_display() -> str:
     """
     Detect display server (x11, wayland, or wslg).
@@ -127,6 +191,7 @@ def detect_display() -> str:
     return "x11"
 
 
+@functools.lru_cache(maxsize=1)
 def detect_audio() -> str:
     """
     Detect audio system (pulseaudio or none).
@@ -135,19 +200,12 @@ def detect_audio() -> str:
         str: 'pulseaudio' or 'none'
     """
     # Check if PulseAudio/PipeWire socket exists
-    uid = os.getuid()
-    pulse_socket = Path(f"/run/user/{uid}/pulse/native")
-
-    if pulse_socket.exists():
+    if PULSE_SOCKET.exists():
         return "pulseaudio"
 
     # Try pactl command
-    try:
-        result = subprocess.run(["pactl", "info"], capture_output=True, text=True, timeout=2)
-        if result.returncode == 0 and "Server Name:" in result.stdout:
-            return "pulseaudio"
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    if "Server Name:" in _pactl_info():
+        return "pulseaudio"
 
     # Default to none (container will run without audio)
     return "none"
@@ -194,7 +252,7 @@ def detect_compose_provider(runtime: str) -> str:
         return ""
 
     # A standalone `docker-compose` on PATH (Compose v2 ships one).
-    standalone = shutil.which("docker-compose")
+    standalone = which("docker-compose")
     if standalone and _is_compose_v2(standalone):
         return standalone
 
@@ -209,7 +267,7 @@ def detect_compose_provider(runtime: str) -> str:
 
 def has_legacy_podman_compose() -> bool:
     """Return True if the legacy python `podman-compose` is installed."""
-    return shutil.which("podman-compose") is not None
+    return which("podman-compose") is not None
 
 
 def detect_ui_scale() -> float:
@@ -349,7 +407,7 @@ def _parse_qt_screen_factors(value: str) -> float:
 
 def _detect_kde_scale() -> float:
     """Read the per-output scale from KDE Plasma via kscreen-doctor."""
-    if not shutil.which("kscreen-doctor"):
+    if not which("kscreen-doctor"):
         return 0.0
     try:
         result = subprocess.run(
@@ -376,42 +434,63 @@ def _detect_kde_scale() -> float:
         return 0.0
 
 
-def get_detection_details() -> Dict[str, Dict[str, any]]:
+def get_detection_details(rescan: bool = True) -> Dict[str, Dict[str, any]]:
     """
     Get detailed detection information for display to user.
 
+    Args:
+        rescan: Forget memoized detection results first (False reuses the
+            values detect_system() already found in this process)
+
     Returns:
         dict: Detailed info about each detected component
     """
-    runtime = detect_runtime()
-    runtime_path = shutil.which(runtime) if shutil.which(runtime) else "Not found"
-
-    gpu = detect_gpu()
-    gpu_details = _get_gpu_details(gpu)
-
-    display = detect_display()
-    display_value = (
-        os.environ.get("DISPLAY") if display == "x11" else os.environ.get("WAYLAND_DISPLAY", "")
-    )
+    # A report is normally an explicit rescan; the probes below then share
+    # one pactl run and one lookup per executable
+    if rescan:
+        invalidate_detection()
+
+    def _probe_gpu():
+        # Read lspci here so the vendor check and the model lookup use the
+        # same output, whichever of them would have run it first
+        lspci_out = _lspci_output()
+        gpu = detect_gpu()
+        return gpu, _get_gpu_details(gpu, lspci_out)
+
+    # Run the subprocess-bound probes concurrently. Each tool's detect/details
+    # pair stays in one task so the memoized lspci/pactl output is shared.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        gpu_future = executor.submit(_probe_gpu)
+        audio_future = executor.submit(lambda: (detect_audio(), _get_audio_details()))
+        resolution_future = executor.submit(detect_screen_resolution)
+        scale_future = executor.submit(detect_ui_scale)
+
+        runtime = detect_runtime()
+        runtime_path = which(runtime) or "Not found"
+
+        display = detect_display()
+        display_value = (
+            os.environ.get("DISPLAY") if display == "x11" else os.environ.get("WAYLAND_DISPLAY", "")
+        )
 
-    audio = detect_audio()
-    audio_details = _get_audio_details()
+    gpu, gpu_details = gpu_future.result()
+    audio, audio_details = audio_future.result()
 
     return {
         "runtime": {
             "value": runtime,
             "path": runtime_path,
-            "available": shutil.which(runtime) is not None,
+            "available": runtime_path != "Not found",
         },
         "gpu": {"value": gpu, "details": gpu_details, "devices_exist": _check_gpu_devices(gpu)},
         "display": {
             "value": display,
             "session_type": os.environ.get("XDG_SESSION_TYPE", "unknown"),
             "display_var": display_value,
-            "resolution": detect_screen_resolution(),
+            "resolution": resolution_future.result(),
         },
         "audio": {"value": audio, "details": audio_details},
-        "ui_scale": {"value": detect_ui_scale()},
+        "ui_scale": {"value": scale_future.result()},
     }
 
 
@@ -422,42 +501,50 @@ _GPU_VENDOR_KEYWORDS = {
     "intel": ("intel",),
 }
 
+# Graphics controller lines in lspci output, and one whole-word pattern per
+# vendor (checked in the order above; whole words so "ati" doesn't match
+# "Corporation"), so each line is scanned without lowercasing
+_GPU_LINE_RE = re.compile(r"^.*(?:vga|3d controller|display).*$", re.IGNORECASE | re.MULTILINE)
+_GPU_VENDOR_RES = {
+    vendor: re.compile(rf"\b(?:{'|'.join(keywords)})\b", re.IGNORECASE)
+    for vendor, keywords in _GPU_VENDOR_KEYWORDS.items()
+}
 
-def _get_gpu_details(gpu_type: str) -> str:
-    """Get GPU model details from lspci."""
-    keywords = _GPU_VENDOR_KEYWORDS.get(gpu_type, ())
-    try:
-        result = subprocess.run(["lspci"], capture_output=True, text=True, timeout=2)
-        for line in result.stdout.split("\n"):
-            line_lower = line.lower()
-            if "vga" in line_lower or "3d" in line_lower or "display" in line_lower:
-                if any(k in line_lower for k in keywords):
-                    # Extract GPU name from line
-                    parts = line.split(": ", 1)
-                    if len(parts) > 1:
-                        return parts[1].strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+
+def _get_gpu_details(gpu_type: str, lspci_out: Optional[str] = None) -> str:
+    """
+    Get GPU model details from lspci.
+
+    Args:
+        gpu_type: 'nvidia', 'amd', or 'intel'
+        lspci_out: lspci output already read by the caller (read here if None)
+    """
+    vendor_re = _GPU_VENDOR_RES.get(gpu_type)
+    if vendor_re:
+        if lspci_out is None:
+            lspci_out = _lspci_output()
+        for match in _GPU_LINE_RE.finditer(lspci_out):
+            line = match.group()
+            if vendor_re.search(line):
+                # Extract GPU name from line
+                parts = line.split(": ", 1)
+                if len(parts) > 1:
+                    return parts[1].strip()
     return f"{gpu_type.upper()} GPU"
 
 
 def _check_gpu_devices(gpu_type: str) -> bool:
     """Check if GPU devices actually exist."""
     if gpu_type == "nvidia":
-        return Path("/dev/nvidia0").exists()
+        return NVIDIA_DEVICE.exists()
     if gpu_type in ("amd", "intel"):
-        return Path("/dev/dri").exists()
+        return DRI_DIR.exists()
     return False
 
 
 def _get_audio_details() -> str:
     """Get audio server details."""
-    try:
-        result = subprocess.run(["pactl", "info"], capture_output=True, text=True, timeout=2)
-        if result.returncode == 0:
-            for line in result.stdout.split("\n"):
-                if "Server Name:" in line:
-                    return line.split(":", 1)[1].strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    for line in _pactl_info().splitlines():
+        if "Server Name:" in line:
+            return line.split(":", 1)[1].strip()
     return "No audio detected"
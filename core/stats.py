@@ -0,0 +1,205 @@
+"""
+Container resource sampling for Minecraft Launcher.
+Reads cgroup v2 and procfs counters directly instead of forking `<runtime> stats`.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .container import CONTAINER_NAME
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# `docker stats --format` template for the fallback path: "cpu|mem usage / limit|net in / net out"
+DOCKER_STATS_FORMAT = "{{.CPUPerc}}|{{.MemUsage}}|{{.NetIO}}"
+
+
+class CgroupStats:
+    """Samples CPU, memory and network usage of a running container."""
+
+    def __init__(self, cgroup_dir: Path, pid: int):
+        """
+        Initialize the sampler and take the baseline CPU reading.
+
+        Args:
+            cgroup_dir: The container's cgroup v2 directory
+            pid: Host PID of a process inside the container (for its netns)
+
+        Raises:
+            OSError: If the cgroup counter files cannot be opened or read
+            ValueError: If cpu.stat has no usage_usec line
+        """
+        # Opened once and re-read from offset 0 on every sample
+        self._cpu_stat = open(cgroup_dir / "cpu.stat", "rb", buffering=0)  # noqa: SIM115
+        try:
+            self._mem_current = open(cgroup_dir / "memory.current", "rb", buffering=0)  # noqa: SIM115
+        except BaseException:
+            self._cpu_stat.close()
+            raise
+        # for_pid() turns a failed baseline into None; don't leave the
+        # handles for the garbage collector
+        try:
+            self._net_dev = Path(f"/proc/{pid}/net/dev")
+            self._mem_max = _read_limit(cgroup_dir / "memory.max")
+            self._last_usage = self._read_cpu_usage()
+        except BaseException:
+            self.close()
+            raise
+        self._last_time = time.monotonic()
+
+    @classmethod
+    def for_container(cls, runtime: str, name: str = CONTAINER_NAME) -> Optional["CgroupStats"]:
+        """
+        Resolve a running container's cgroup and build a sampler for it.
+
+        Args:
+            runtime: 'podman' or 'docker'
+            name: Container name
+
+        Returns:
+            CgroupStats, or None if the container isn't running or the host
+            does not use a unified (v2) cgroup hierarchy
+        """
+        # Checked here too so hosts without cgroup v2 don't fork `inspect`
+        if not (CGROUP_ROOT / "cgroup.controllers").exists():
+            return None
+        pid = container_pid(runtime, name)
+        return cls.for_pid(pid) if pid else None
+
+    @classmethod
+    def for_pid(cls, pid: int) -> Optional["CgroupStats"]:
+        """
+        Build a sampler for the cgroup of a container process.
+
+        Args:
+            pid: Host PID of a process inside the container
+
+        Returns:
+            CgroupStats, or None if the host does not use a unified (v2) cgroup
+            hierarchy or the process's counters can't be read
+        """
+        if not (CGROUP_ROOT / "cgroup.controllers").exists():
+            return None
+        try:
+            cgroup_dir = _cgroup_dir_for_pid(pid)
+            return None if cgroup_dir is None else cls(cgroup_dir, pid)
+        except (OSError, ValueError):
+            return None
+
+    def sample(self) -> Optional[Dict[str, float]]:
+        """
+        Read the current counters.
+
+        Returns:
+            dict with keys cpu_percent (100 = one full core, since the previous
+            sample), mem_usage and mem_limit (bytes; limit 0 if unlimited),
+            net_rx and net_tx (bytes, None if unreadable) - or None once the
+            container's cgroup is gone (container stopped)
+        """
+        try:
+            usage = self._read_cpu_usage()
+            self._mem_current.seek(0)
+            mem_usage = int(self._mem_current.read())
+        except (OSError, ValueError):
+            return None
+
+        now = time.monotonic()
+        elapsed_usec = (now - self._last_time) * 1_000_000
+        cpu_percent = (usage - self._last_usage) / elapsed_usec * 100 if elapsed_usec > 0 else 0.0
+        self._last_usage = usage
+        self._last_time = now
+
+        net_rx, net_tx = self._read_net()
+        return {
+            "cpu_percent": cpu_percent,
+            "mem_usage": mem_usage,
+            "mem_limit": self._mem_max,
+            "net_rx": net_rx,
+            "net_tx": net_tx,
+        }
+
+    def close(self):
+        """Close the cgroup file handles."""
+        self._cpu_stat.close()
+        self._mem_current.close()
+
+    def _read_cpu_usage(self) -> int:
+        """Return cumulative CPU time (usec) from cpu.stat."""
+        self._cpu_stat.seek(0)
+        for line in self._cpu_stat.read().splitlines():
+            if line.startswith(b"usage_usec "):
+                return int(line[11:])
+        raise ValueError("usage_usec missing from cpu.stat")
+
+    def _read_net(self):
+        """Sum received/transmitted bytes over the container's non-loopback interfaces."""
+        try:
+            data = self._net_dev.read_bytes()
+        except OSError:
+            return None, None
+        rx = tx = 0
+        # Two header lines, then "iface: rx_bytes ... (8 rx fields) tx_bytes ..."
+        for line in data.splitlines()[2:]:
+            iface, _, counters = line.partition(b":")
+            if iface.strip() == b"lo":
+                continue
+            fields = counters.split()
+            if len(fields) >= 9:
+                rx += int(fields[0])
+                tx += int(fields[8])
+        return rx, tx
+
+
+def container_pid(runtime: str, name: str = CONTAINER_NAME) -> int:
+    """
+    Return the host PID of a container's main process.
+
+    Args:
+        runtime: 'podman' or 'docker'
+        name: Container name
+
+    Returns:
+        int: The PID, or 0 if the container isn't running (or can't be inspected)
+    """
+    try:
+        result = subprocess.run(
+            [runtime, "inspect", "--format", "{{.State.Pid}}", name],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return int(result.stdout.strip() or 0) if result.returncode == 0 else 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError, OSError):
+        return 0
+
+
+def _cgroup_dir_for_pid(pid: int) -> Optional[Path]:
+    """Return the cgroup v2 directory of a process, or None if not found."""
+    for line in Path(f"/proc/{pid}/cgroup").read_text().splitlines():
+        if line.startswith("0::"):
+            cgroup_dir = CGROUP_ROOT / line[3:].lstrip("/")
+            if (cgroup_dir / "cpu.stat").exists():
+                return cgroup_dir
+    return None
+
+
+def _read_limit(path: Path) -> int:
+    """Read a cgroup limit file; 'max' (or an unreadable file) means 0/unlimited."""
+    try:
+        value = path.read_text().strip()
+        return 0 if value == "max" else int(value)
+    except (OSError, ValueError):
+        return 0
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count in the same decimal units `podman stats` prints."""
+    if size < 1e3:
+        return f"{int(size)}B"
+    for unit, factor in (("kB", 1e3), ("MB", 1e6), ("GB", 1e9), ("TB", 1e12)):
+        # Move up a unit when rounding would print 1000 (as '1e+03')
+        if float(f"{size / factor:.3g}") < 1e3:
+            return f"{size / factor:.3g}{unit}"
+    return f"{size / 1e12:.0f}TB"
@@ -4,12 +4,24 @@ Performs pre-flight checks to ensure system is ready.
 """
 
 import os
-import shutil
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from .detector import detect_compose_provider, has_legacy_podman_compose
+from .detector import (
+    DRI_DIR,
+    NVIDIA_CTL_DEVICE,
+    NVIDIA_DEVICE,
+    PULSE_SOCKET,
+    detect_compose_provider,
+    has_legacy_podman_compose,
+    which,
+)
+
+_X11_SOCKET_DIR = Path("/tmp/.X11-unix")
+_WSLG_DIR = Path("/mnt/wslg")
+_SND_DIR = Path("/dev/snd")
 
 
 class ValidationIssue:
@@ -33,26 +45,67 @@ class ValidationIssue:
         return self.level == "error"
 
 
-def validate_system(config: Dict[str, str]) -> Tuple[bool, List[ValidationIssue]]:
+@dataclass
+class _ProbeCache:
+    """Host state read once per validate_system() call and shared by the checks."""
+
+    runtime_path: Optional[str]
+    xhost_path: Optional[str]
+    has_nvidia0: bool
+    has_nvidiactl: bool
+    has_dri: bool
+    has_snd: bool
+    has_pulse_socket: bool
+    has_x11_socket: bool
+    has_wslg: bool
+    display_env: str
+    wayland_env: str
+    compose_provider_env: str
+
+    @classmethod
+    def collect(cls, config: Dict[str, str]) -> "_ProbeCache":
+        """Stat the device nodes/sockets and read the environment a single time."""
+        return cls(
+            runtime_path=which(config["runtime"]),
+            xhost_path=which("xhost"),
+            has_nvidia0=NVIDIA_DEVICE.exists(),
+            has_nvidiactl=NVIDIA_CTL_DEVICE.exists(),
+            has_dri=DRI_DIR.exists(),
+            has_snd=_SND_DIR.exists(),
+            has_pulse_socket=PULSE_SOCKET.exists(),
+            has_x11_socket=_X11_SOCKET_DIR.exists(),
+            has_wslg=_WSLG_DIR.exists(),
+            display_env=os.environ.get("DISPLAY", ""),
+            wayland_env=os.environ.get("WAYLAND_DISPLAY", ""),
+            compose_provider_env=os.environ.get("PODMAN_COMPOSE_PROVIDER", ""),
+        )
+
+
+def validate_system(
+    config: Dict[str, str], deep: bool = False
+) -> Tuple[bool, List[ValidationIssue]]:
     """
     Perform all validation checks.
 
     Args:
         config: Configuration dict
+        deep: Also run checks that spawn the tools (e.g. '<runtime> --version');
+              used by the doctor command
 
     Returns:
         tuple: (is_valid, list_of_issues)
     """
     issues = []
+    probes = _ProbeCache.collect(config)
 
     # Run all validation checks
-    issues.extend(_check_runtime(config))
-    issues.extend(_check_compose_provider(config))
-    issues.extend(_check_gpu(config))
-    issues.extend(_check_display(config))
-    issues.extend(_check_audio(config))
+    issues.extend(_check_runtime(config, probes, deep))
+    issues.extend(_check_compose_provider(config, probes))
+    issues.extend(_check_gpu(config, probes))
+    issues.extend(_check_display(config, probes))
+    issues.extend(_check_audio(config, probes))
     issues.extend(_check_compose_files(config))
-    issues.extend(_check_xhost(config))
+    issues.extend(_check_xhost(config, probes))
 
     # System is valid only if there are no blocking errors
     has_errors = any(issue.is_blocking() for issue in issues)
@@ -60,12 +113,14 @@ def validate_system(config: Dict[str, str]) -> Tuple[bool, List[ValidationIssue]
     return not has_errors, issues
 
 
-def _check_runtime(config: Dict[str, str]) -> List[ValidationIssue]:
-    """Check if container runtime is available."""
+def _check_runtime(
+    config: Dict[str, str], probes: _ProbeCache, deep: bool = False
+) -> List[ValidationIssue]:
+    """Check if container runtime is available (and, when deep, that it runs)."""
     issues = []
     runtime = config["runtime"]
 
-    if not shutil.which(runtime):
+    if not probes.runtime_path:
         issues.append(
             ValidationIssue(
                 f"{runtime} is not installed or not in PATH",
@@ -73,10 +128,24 @@ def _check_runtime(config: Dict[str, str]) -> List[ValidationIssue]:
                 fix_hint=f"Install {runtime}: https://{runtime}.io/getting-started/installation",
             )
         )
-    else:
+    elif not os.access(probes.runtime_path, os.X_OK):
+        issues.append(
+            ValidationIssue(
+                f"{runtime} at {probes.runtime_path} is not executable",
+                level="error",
+                fix_hint=f"Check the permissions of {probes.runtime_path}",
+            )
+        )
+    elif deep:
         # Try to run runtime --version to ensure it works
         try:
-            result = subprocess.run([runtime, "--version"], capture_output=True, timeout=5)
+            # Only the exit code matters; don't pipe and decode the output
+            result = subprocess.run(
+                [runtime, "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
             if result.returncode != 0:
                 issues.append(
                     ValidationIssue(
@@ -93,13 +162,13 @@ def _check_runtime(config: Dict[str, str]) -> List[ValidationIssue]:
     return issues
 
 
-def _check_compose_provider(config: Dict[str, str]) -> List[ValidationIssue]:
+def _check_compose_provider(config: Dict[str, str], probes: _ProbeCache) -> List[ValidationIssue]:
     """Warn if podman would fall back to the legacy python podman-compose."""
     issues = []
     if config["runtime"] != "podman":
         return issues
 
-    if os.environ.get("PODMAN_COMPOSE_PROVIDER"):
+    if probes.compose_provider_env:
         return issues
 
     if detect_compose_provider("podman"):
@@ -134,7 +203,7 @@ def _check_compose_provider(config: Dict[str, str]) -> List[ValidationIssue]:
     return issues
 
 
-def _check_gpu(config: Dict[str, str]) -> List[ValidationIssue]:
+def _check_gpu(config: Dict[str, str], probes: _ProbeCache) -> List[ValidationIssue]:
     """Check if GPU devices exist."""
     issues = []
     gpu = config["gpu"]
@@ -145,7 +214,7 @@ def _check_gpu(config: Dict[str, str]) -> List[ValidationIssue]:
         return issues
 
     if gpu == "nvidia":
-        if not Path("/dev/nvidia0").exists():
+        if not probes.has_nvidia0:
             issues.append(
                 ValidationIssue(
                     "NVIDIA GPU selected but /dev/nvidia0 not found",
@@ -153,7 +222,7 @@ def _check_gpu(config: Dict[str, str]) -> List[ValidationIssue]:
                     fix_hint="Install NVIDIA drivers or select 'amd' GPU type",
                 )
             )
-        if not Path("/dev/nvidiactl").exists():
+        if not probes.has_nvidiactl:
             issues.append(
                 ValidationIssue(
                     "/dev/nvidiactl device not found",
@@ -162,7 +231,7 @@ def _check_gpu(config: Dict[str, str]) -> List[ValidationIssue]:
                 )
             )
     elif gpu in ("amd", "intel"):
-        if not Path("/dev/dri").exists():
+        if not probes.has_dri:
             issues.append(
                 ValidationIssue(
                     "/dev/dri not found - no GPU acceleration available",
@@ -174,13 +243,13 @@ def _check_gpu(config: Dict[str, str]) -> List[ValidationIssue]:
     return issues
 
 
-def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
+def _check_display(config: Dict[str, str], probes: _ProbeCache) -> List[ValidationIssue]:
     """Check if display server is available."""
     issues = []
     display = config["display"]
 
     if display == "x11":
-        if not os.environ.get("DISPLAY"):
+        if not probes.display_env:
             issues.append(
                 ValidationIssue(
                     "X11 selected but DISPLAY environment variable not set",
@@ -188,12 +257,12 @@ def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
                     fix_hint="Ensure you're running in an X11 session",
                 )
             )
-        if not Path("/tmp/.X11-unix").exists():
+        if not probes.has_x11_socket:
             issues.append(
                 ValidationIssue("X11 socket directory /tmp/.X11-unix not found", level="warning")
             )
     elif display == "wayland":
-        if not os.environ.get("WAYLAND_DISPLAY"):
+        if not probes.wayland_env:
             issues.append(
                 ValidationIssue(
                     "Wayland selected but WAYLAND_DISPLAY not set",
@@ -202,7 +271,7 @@ def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
                 )
             )
         # Java/Swing (TLauncher) runs via XWayland, which needs DISPLAY + the X socket.
-        if not os.environ.get("DISPLAY"):
+        if not probes.display_env:
             issues.append(
                 ValidationIssue(
                     "DISPLAY not set; TLauncher (Java) needs XWayland to show a window",
@@ -210,7 +279,7 @@ def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
                     fix_hint="Ensure XWayland is running (default on GNOME/KDE Wayland sessions)",
                 )
             )
-        if not Path("/tmp/.X11-unix").exists():
+        if not probes.has_x11_socket:
             issues.append(
                 ValidationIssue(
                     "X11 socket /tmp/.X11-unix not found (needed for XWayland)",
@@ -218,7 +287,7 @@ def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
                 )
             )
     elif display == "wslg":
-        if not Path("/mnt/wslg").exists():
+        if not probes.has_wslg:
             issues.append(
                 ValidationIssue(
                     "WSLg not found at /mnt/wslg",
@@ -226,7 +295,7 @@ def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
                     fix_hint="Update WSL ('wsl --update') and use WSL2 with WSLg (Windows 11)",
                 )
             )
-        if not os.environ.get("DISPLAY"):
+        if not probes.display_env:
             issues.append(
                 ValidationIssue(
                     "DISPLAY not set; WSLg should provide it",
@@ -238,7 +307,7 @@ def _check_display(config: Dict[str, str]) -> List[ValidationIssue]:
     return issues
 
 
-def _check_audio(config: Dict[str, str]) -> List[ValidationIssue]:
+def _check_audio(config: Dict[str, str], probes: _ProbeCache) -> List[ValidationIssue]:
     """Check if audio system is available."""
     issues = []
     audio = config["audio"]
@@ -248,19 +317,16 @@ def _check_audio(config: Dict[str, str]) -> List[ValidationIssue]:
         return issues
 
     if audio == "pulseaudio":
-        uid = os.getuid()
-        pulse_socket = Path(f"/run/user/{uid}/pulse/native")
-
-        if not pulse_socket.exists():
+        if not probes.has_pulse_socket:
             issues.append(
                 ValidationIssue(
-                    f"PulseAudio socket not found at {pulse_socket}",
+                    f"PulseAudio socket not found at {PULSE_SOCKET}",
                     level="warning",
                     fix_hint="Audio may not work. Start PulseAudio/PipeWire or select 'none' for audio",
                 )
             )
 
-        if not Path("/dev/snd").exists():
+        if not probes.has_snd:
             issues.append(
                 ValidationIssue(
                     "/dev/snd not found - ALSA devices unavailable",
@@ -293,13 +359,13 @@ def _check_compose_files(config: Dict[str, str]) -> List[ValidationIssue]:
     return issues
 
 
-def _check_xhost(config: Dict[str, str]) -> List[ValidationIssue]:
+def _check_xhost(config: Dict[str, str], probes: _ProbeCache) -> List[ValidationIssue]:
     """Check if xhost permissions are set for X11."""
     issues = []
 
     if config["display"] in ("x11", "wayland", "wslg") and config.get("auto_xhost", True):
         # Check if xhost command is available
-        if not shutil.which("xhost"):
+        if not probes.xhost_path:
             issues.append(
                 ValidationIssue(
                     "xhost command not found",
@@ -341,7 +407,7 @@ def run_xhost_if_needed(config: Dict[str, str]) -> bool:
     if config["display"] not in ("x11", "wayland", "wslg") or not config.get("auto_xhost", True):
         return True
 
-    if not shutil.which("xhost"):
+    if not which("xhost"):
         return False
 
     try:
@@ -350,7 +416,10 @@ def run_xhost_if_needed(config: Dict[str, str]) -> bool:
             return False
 
         result = subprocess.run(
-            ["xhost", f"+SI:localuser:{username}"], capture_output=True, timeout=5
+            ["xhost", f"+SI:localuser:{username}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5,
         )
         return result.returncode == 0
     except Exception:
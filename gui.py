@@ -3,6 +3,13 @@ GUI interface for Minecraft Launcher.
 Provides graphical Tkinter-based interaction.
 """
 
+import collections
+import concurrent.futures
+import functools
+import json
+import os
+import re
+import subprocess
 import threading
 import time
 import tkinter as tk
@@ -13,14 +20,12 @@ from typing import Dict
 from core.composer import get_command_preview
 from core.config import load_config, merge_config, save_config
 from core.container import ContainerManager, image_exists, start_container_async
-from core.detector import detect_system, get_detection_details
-from core.log_analyzer import analyze_lines
-from core.validator import run_xhost_if_needed, validate_system
+from core.detect_cache import get_cached_detection
+from core.detector import get_detection_details
+from core.stats import DOCKER_STATS_FORMAT, CgroupStats, container_pid, format_bytes
 
 
 def _read_app_version() -> str:
-    import re
-
     try:
         toml = (Path(__file__).parent / "pyproject.toml").read_text()
         m = re.search(r'^version\s*=\s*"([^"]+)"', toml, re.MULTILINE)
@@ -31,6 +36,62 @@ def _read_app_version() -> str:
 
 APP_VERSION = _read_app_version()
 
+# CPU core count for normalizing container stats
+_CPU_CORES = os.cpu_count() or 1
+
+# Lines kept in the log view; older ones are dropped as new output arrives
+_MAX_LOG_LINES = 5000
+
+# Written by Edit Config when no config file exists yet
+_DEFAULT_CONFIG_YAML = (
+    b"# Minecraft Launcher Launcher Configuration\n"
+    b"# Leave values empty to use auto-detection\n"
+    b"\n"
+    b"runtime: ''\n"
+    b"gpu: ''\n"
+    b"display: ''\n"
+    b"audio: ''\n"
+    b"auto_xhost: true\n"
+)
+
+# Seconds a Doctor run reuses the previous detection report
+_DOCTOR_DETAILS_TTL = 10.0
+
+# Status label text and color name per status (see _update_status)
+_STATUSES = {
+    "ready": ("○ Ready", "success"),
+    "starting": ("◐ Starting...", "warning"),
+    "running": ("● Running", "success"),
+    "already_running": ("● Already Running", "warning"),
+    "stopping": ("◐ Stopping...", "warning"),
+    "restarting": ("◐ Restarting...", "warning"),
+    "stopped": ("○ Stopped", "gray"),
+    "validation_failed": ("✗ Validation failed", "error"),
+}
+
+# Start/Stop/Restart button states per container layout (see _set_control_layout)
+_CONTROL_LAYOUTS = {
+    "stopped": (tk.NORMAL, tk.DISABLED, tk.DISABLED),
+    "running": (tk.DISABLED, tk.NORMAL, tk.NORMAL),
+    "busy": (tk.DISABLED, tk.DISABLED, tk.DISABLED),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_orjson():
+    """Return the orjson module if installed, else None (stdlib json fallback)."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_loads(raw):
+    """Parse JSON text or bytes, with orjson when available."""
+    orjson = _get_orjson()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 
 class MinecraftLauncherGUI:
     """Main GUI application for Minecraft Launcher."""
@@ -56,8 +117,9 @@ class MinecraftLauncherGUI:
         # Modern theme and styling
         self._setup_theme()
 
-        # X11: window icon and class so taskbar/dock shows our icon
-        self._set_window_icon()
+        # X11: window icon and class so taskbar/dock shows our icon. The icon is
+        # set once the main loop runs so a Pillow fallback can't delay first paint.
+        self.window.after(50, self._set_window_icon)
         # WM_CLASS for taskbar/dock (wm_class not available on all Tk builds)
         try:
             self.window.tk.call(
@@ -68,16 +130,39 @@ class MinecraftLauncherGUI:
 
         self.config = {}
         self.detected = {}
+        # Dropdown values set by _apply_saved_config(); detection leaves any
+        # the user has changed since alone
+        self._pinned_values = {}
+        # _gather_config() result; cleared when a dropdown or detection changes
+        self._config_cache = None
+        # Last get_detection_details() report and when it was taken (Doctor)
+        self._details_cache = None
+        self._details_ts = 0.0
         self.manager = None
+        # The config self.manager was built for (see _get_manager)
+        self._manager_config_key = None
+        # Runs stop/restart one at a time, so a double click queues instead of
+        # racing two `compose down`s
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mc-launcher"
+        )
         self._user_requested_stop = False
+        # True while a _notify() dialog is open
+        self._modal_open = False
         self._monitor_enabled = False
         self._monitor_job = None
+        # False while the window is minimized; the monitor pauses meanwhile
+        self._window_visible = True
         self._container_pid = None
-
-        # Get CPU core count for normalizing stats
-        import os
-
-        self._cpu_cores = os.cpu_count() or 1
+        self._stats_worker_busy = False
+        self._stats_sampler = None
+        # Set once the container's cgroup v2 counters turned out to be unreadable;
+        # the monitor then uses `<runtime> stats` without retrying the cgroup
+        self._cgroup_unavailable = False
+        # Long-running `nvidia-smi -lms` and the last utilization it printed
+        # (written by its reader thread, read by the stats worker)
+        self._gpu_smi = None
+        self._gpu_util = "--"
 
         self._svc_poll_job = None
         # Cross-thread poll results. Workers only WRITE these plain values; the
@@ -92,12 +177,35 @@ class MinecraftLauncherGUI:
         # transition is in flight, but only for a bounded window so a missed
         # "started" signal can't freeze the buttons forever (see _in_transition).
         self._transition_at = 0.0
+        # True from a Start press until the launch begins (or is abandoned), and
+        # while an image build runs. Unlike _transition_at these aren't time
+        # bounded: probing, validation and a first-run build can take minutes.
+        self._start_pending = False
+        self._rebuild_busy = False
         self._state_poll_job = None
+        # Messages waiting for the next idle-time log flush (see log())
+        self._log_buffer = collections.deque()
+        # Lines currently shown in the log view, so readers (copy, bug report,
+        # log analysis) don't have to pull the text back out of Tk
+        self._log_lines = collections.deque(maxlen=_MAX_LOG_LINES)
+        self._log_flush_pending = False
         self._create_widgets()
         self._detect_and_load()
         threading.Thread(target=self._check_for_updates_async, daemon=True).start()
         self.window.after(1500, self._schedule_service_poll)
         self.window.after(2000, self._schedule_state_poll)
+        self.window.after(100, self._pump_logs)
+        self.window.bind("<Map>", self._on_window_map)
+        self.window.bind("<Unmap>", self._on_window_map)
+
+    def _on_window_map(self, event):
+        """Track whether the window is shown; resume the monitor when it is again."""
+        # Bindings on the root window also see its children's events
+        if event.widget is not self.window:
+            return
+        self._window_visible = event.type == tk.EventType.Map
+        if self._window_visible and self._monitor_enabled:
+            self._update_resource_stats()
 
     def _setup_theme(self):
         """Set up modern theme and colors."""
@@ -120,60 +228,46 @@ class MinecraftLauncherGUI:
         # Configure window background
         self.window.configure(bg=bg_color)
 
-        # Configure styles
-        style.configure("TFrame", background=bg_color)
-        style.configure("TLabel", background=bg_color, foreground=fg_color, font=("Segoe UI", 10))
-        style.configure(
-            "TLabelframe", background=bg_color, foreground=fg_color, bordercolor=accent_color
-        )
-        style.configure(
-            "TLabelframe.Label",
-            background=bg_color,
-            foreground=accent_color,
-            font=("Segoe UI", 10, "bold"),
+        # Configure styles and the combobox dropdown listbox colors in one Tcl
+        # evaluation instead of a round-trip per configure/map/option_add call
+        font = '"{Segoe UI} 10"'
+        bold_font = '"{Segoe UI} 10 bold"'
+        button_font = '"{Segoe UI} 9"'
+        hint_font = '"{Segoe UI} 8"'
+        self.window.tk.eval(
+            f"""
+            ttk::style configure TFrame -background {bg_color}
+            ttk::style configure TLabel -background {bg_color} -foreground {fg_color} \
+                -font {font}
+            ttk::style configure Hint.TLabel -foreground gray -font {hint_font}
+            ttk::style configure TLabelframe -background {bg_color} -foreground {fg_color} \
+                -bordercolor {accent_color}
+            ttk::style configure TLabelframe.Label -background {bg_color} \
+                -foreground {accent_color} -font {bold_font}
+
+            ttk::style configure TButton -background {button_bg} -foreground {fg_color} \
+                -bordercolor {accent_color} -focuscolor {accent_color} -font {button_font} \
+                -padding 8
+            ttk::style map TButton \
+                -background [list active {button_active} pressed {accent_color}] \
+                -foreground [list active {fg_color}]
+
+            ttk::style configure TCombobox -fieldbackground {button_bg} \
+                -background {button_bg} -foreground {fg_color} -arrowcolor {accent_color} \
+                -selectbackground {accent_color} -selectforeground {fg_color}
+            ttk::style map TCombobox \
+                -fieldbackground [list readonly {button_bg}] \
+                -selectbackground [list readonly {accent_color}] \
+                -selectforeground [list readonly {fg_color}]
+
+            option add *TCombobox*Listbox.background {button_bg}
+            option add *TCombobox*Listbox.foreground {fg_color}
+            option add *TCombobox*Listbox.selectBackground {accent_color}
+            option add *TCombobox*Listbox.selectForeground {fg_color}
+            option add *TCombobox*Listbox.font {font}
+            """
         )
 
-        # Button styling
-        style.configure(
-            "TButton",
-            background=button_bg,
-            foreground=fg_color,
-            bordercolor=accent_color,
-            focuscolor=accent_color,
-            font=("Segoe UI", 9),
-            padding=8,
-        )
-        style.map(
-            "TButton",
-            background=[("active", button_active), ("pressed", accent_color)],
-            foreground=[("active", fg_color)],
-        )
-
-        # Combobox styling
-        style.configure(
-            "TCombobox",
-            fieldbackground=button_bg,
-            background=button_bg,
-            foreground=fg_color,
-            arrowcolor=accent_color,
-            selectbackground=accent_color,
-            selectforeground=fg_color,
-        )
-
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", button_bg)],
-            selectbackground=[("readonly", accent_color)],
-            selectforeground=[("readonly", fg_color)],
-        )
-
-        # Configure combobox dropdown listbox colors
-        self.window.option_add("*TCombobox*Listbox.background", button_bg)
-        self.window.option_add("*TCombobox*Listbox.foreground", fg_color)
-        self.window.option_add("*TCombobox*Listbox.selectBackground", accent_color)
-        self.window.option_add("*TCombobox*Listbox.selectForeground", fg_color)
-        self.window.option_add("*TCombobox*Listbox.font", ("Segoe UI", 10))
-
         # Configure colors for status labels
         self.colors = {
             "bg": bg_color,
@@ -185,6 +279,25 @@ class MinecraftLauncherGUI:
             "info": "#2196f3",
         }
 
+        # Color names used by _STATUSES, each with its own label style
+        # so a status change only swaps the style instead of re-parsing a color
+        colors = self.colors
+        status_colors = {
+            "success": colors["success"],
+            "warning": colors["warning"],
+            "error": colors["error"],
+            "gray": "#888888",
+        }
+        status_font = '"{Segoe UI} 11 bold"'
+        self._status_styles = {name: f"Status.{name.capitalize()}.TLabel" for name in status_colors}
+        self.window.tk.eval(
+            "\n".join(
+                f"ttk::style configure {self._status_styles[name]} -foreground {color} "
+                f"-font {status_font}"
+                for name, color in status_colors.items()
+            )
+        )
+
     def _set_window_icon(self):
         """Set the window icon for taskbar/dock (X11). Keeps a reference to avoid GC."""
         icon_path = Path(__file__).parent / "icon.png"
@@ -257,9 +370,7 @@ class MinecraftLauncherGUI:
         detect_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 12))
 
         # Runtime
-        ttk.Label(detect_frame, text="Runtime:", font=("Segoe UI", 10)).grid(
-            row=0, column=0, sticky=tk.W, padx=(0, 8)
-        )
+        ttk.Label(detect_frame, text="Runtime:").grid(row=0, column=0, sticky=tk.W, padx=(0, 8))
         self.runtime_var = tk.StringVar()
         self.runtime_combo = ttk.Combobox(
             detect_frame,
@@ -270,14 +381,12 @@ class MinecraftLauncherGUI:
         )
         self.runtime_combo.grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
         self.runtime_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
+            detect_frame, text="(detecting…)", style="Hint.TLabel"
         )
         self.runtime_status_label.grid(row=0, column=2, sticky=tk.W)
 
         # GPU
-        ttk.Label(detect_frame, text="GPU:", font=("Segoe UI", 10)).grid(
-            row=0, column=3, sticky=tk.W, padx=(0, 8)
-        )
+        ttk.Label(detect_frame, text="GPU:").grid(row=0, column=3, sticky=tk.W, padx=(0, 8))
         self.gpu_var = tk.StringVar()
         self.gpu_combo = ttk.Combobox(
             detect_frame,
@@ -287,13 +396,11 @@ class MinecraftLauncherGUI:
             width=14,
         )
         self.gpu_combo.grid(row=0, column=4, sticky=tk.W, padx=(0, 20))
-        self.gpu_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
-        )
+        self.gpu_status_label = ttk.Label(detect_frame, text="(detecting…)", style="Hint.TLabel")
         self.gpu_status_label.grid(row=0, column=5, sticky=tk.W)
 
         # Display
-        ttk.Label(detect_frame, text="Display:", font=("Segoe UI", 10)).grid(
+        ttk.Label(detect_frame, text="Display:").grid(
             row=1, column=0, sticky=tk.W, padx=(0, 8), pady=(10, 0)
         )
         self.display_var = tk.StringVar()
@@ -306,12 +413,12 @@ class MinecraftLauncherGUI:
         )
         self.display_combo.grid(row=1, column=1, sticky=tk.W, pady=(10, 0), padx=(0, 20))
         self.display_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
+            detect_frame, text="(detecting…)", style="Hint.TLabel"
         )
         self.display_status_label.grid(row=1, column=2, sticky=tk.W, pady=(10, 0))
 
         # Audio
-        ttk.Label(detect_frame, text="Audio:", font=("Segoe UI", 10)).grid(
+        ttk.Label(detect_frame, text="Audio:").grid(
             row=1, column=3, sticky=tk.W, padx=(0, 8), pady=(10, 0)
         )
         self.audio_var = tk.StringVar()
@@ -323,13 +430,23 @@ class MinecraftLauncherGUI:
             width=14,
         )
         self.audio_combo.grid(row=1, column=4, sticky=tk.W, pady=(10, 0), padx=(0, 20))
-        self.audio_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
-        )
+        self.audio_status_label = ttk.Label(detect_frame, text="(detecting…)", style="Hint.TLabel")
         self.audio_status_label.grid(row=1, column=5, sticky=tk.W, pady=(10, 0))
 
         detect_frame.columnconfigure(5, weight=1)
 
+        # (config key, dropdown variable, detected-value hint) per setting
+        self._config_fields = (
+            ("runtime", self.runtime_var, self.runtime_status_label),
+            ("gpu", self.gpu_var, self.gpu_status_label),
+            ("display", self.display_var, self.display_status_label),
+            ("audio", self.audio_var, self.audio_status_label),
+        )
+
+        # Selecting an option (or setting one from saved config) changes the config
+        for _, var, _ in self._config_fields:
+            var.trace_add("write", self._invalidate_config_cache)
+
         # Control Buttons Frame — 2-row grid so buttons never squish
         control_frame = ttk.Frame(left_frame)
         control_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 15))
@@ -389,8 +506,7 @@ class MinecraftLauncherGUI:
         self.status_label = ttk.Label(
             status_frame,
             text="● Ready",
-            font=("Segoe UI", 11, "bold"),
-            foreground=self.colors["success"],
+            style=self._status_styles["success"],
         )
         self.status_label.pack(side=tk.LEFT)
 
@@ -434,11 +550,15 @@ class MinecraftLauncherGUI:
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
 
-        # Styled scrolled text with dark theme
+        # Styled scrolled text with dark theme. Read-only without an undo stack;
+        # _flush_log() and clear_logs() enable it around their edits.
         self.log_text = scrolledtext.ScrolledText(
             log_frame,
             height=20,
             wrap=tk.WORD,
+            undo=False,
+            maxundo=0,
+            state=tk.DISABLED,
             bg="#1e1e1e",
             fg="#d4d4d4",
             insertbackground="#7cbd3f",
@@ -476,235 +596,333 @@ class MinecraftLauncherGUI:
         # Right-align so it lines up vertically with the profiles' Info button.
         self.btn_monitor_toggle.pack(anchor=tk.E, pady=(0, 8))
 
-        # Stats display with proper grid configuration
-        stats_frame = ttk.Frame(monitor_frame)
-        stats_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Configure grid columns for proper alignment
-        stats_frame.columnconfigure(0, weight=0, minsize=70)  # Label column (fixed width)
-        stats_frame.columnconfigure(1, weight=1)  # Value column (expands)
-
-        # CPU
-        ttk.Label(stats_frame, text="CPU:", font=("Segoe UI", 9, "bold")).grid(
-            row=0, column=0, sticky=tk.W, pady=4
-        )
-        self.cpu_label = ttk.Label(
-            stats_frame, text="--", font=("Consolas", 8), foreground=self.colors["info"]
-        )
-        self.cpu_label.grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
-
-        # Memory
-        ttk.Label(stats_frame, text="RAM:", font=("Segoe UI", 9, "bold")).grid(
-            row=1, column=0, sticky=tk.W, pady=4
-        )
-        self.mem_label = ttk.Label(
-            stats_frame, text="--", font=("Consolas", 8), foreground=self.colors["info"]
-        )
-        self.mem_label.grid(row=1, column=1, sticky=tk.W, padx=(5, 0))
+        # Status
+        self.monitor_status = ttk.Label(monitor_frame, text="Monitor disabled", style="Hint.TLabel")
+        self.monitor_status.pack(pady=(8, 0))
 
-        # I/O Read
-        ttk.Label(stats_frame, text="Net In:", font=("Segoe UI", 9, "bold")).grid(
-            row=2, column=0, sticky=tk.W, pady=4
-        )
-        self.io_read_label = ttk.Label(
-            stats_frame, text="--", font=("Consolas", 8), foreground=self.colors["info"]
-        )
-        self.io_read_label.grid(row=2, column=1, sticky=tk.W, padx=(5, 0))
+        # The stats rows are built on first enable (see _build_monitor_panel)
+        self._monitor_frame = monitor_frame
+        self._monitor_items = {}
 
-        # I/O Write
-        ttk.Label(stats_frame, text="Net Out:", font=("Segoe UI", 9, "bold")).grid(
-            row=3, column=0, sticky=tk.W, pady=4
-        )
-        self.io_write_label = ttk.Label(
-            stats_frame, text="--", font=("Consolas", 8), foreground=self.colors["info"]
-        )
-        self.io_write_label.grid(row=3, column=1, sticky=tk.W, padx=(5, 0))
+    def _build_monitor_panel(self):
+        """Create the stats rows; deferred until the monitor is first enabled.
 
-        # GPU (if available)
-        ttk.Label(stats_frame, text="GPU:", font=("Segoe UI", 9, "bold")).grid(
-            row=4, column=0, sticky=tk.W, pady=4
-        )
-        self.gpu_label = ttk.Label(
-            stats_frame, text="--", font=("Consolas", 8), foreground=self.colors["info"]
-        )
-        self.gpu_label.grid(row=4, column=1, sticky=tk.W, padx=(5, 0))
+        The rows are text items on one canvas rather than a grid of ten labels:
+        a value update is a single itemconfigure, with no geometry management.
+        """
+        # (_collect_stats() key, row title, row height - CPU shows two lines)
+        rows = (
+            ("cpu", "CPU:", 36),
+            ("mem", "RAM:", 26),
+            ("net_in", "Net In:", 26),
+            ("net_out", "Net Out:", 26),
+            ("gpu", "GPU:", 26),
+        )
+        self.stats_canvas = tk.Canvas(
+            self._monitor_frame,
+            height=sum(height for _, _, height in rows),
+            bg=self.colors["bg"],
+            highlightthickness=0,
+        )
+        self.stats_canvas.pack(fill=tk.BOTH, expand=True, before=self.monitor_status)
+
+        # _collect_stats() key -> canvas item of its value text
+        self._monitor_items = {}
+        fg, info = self.colors["fg"], self.colors["info"]
+        y = 4
+        for key, title, height in rows:
+            self.stats_canvas.create_text(
+                0, y, text=title, anchor=tk.NW, font=("Segoe UI", 9, "bold"), fill=fg
+            )
+            self._monitor_items[key] = self.stats_canvas.create_text(
+                75, y + 2, text="--", anchor=tk.NW, font=("Consolas", 8), fill=info
+            )
+            y += height
 
-        # Status
-        self.monitor_status = ttk.Label(
-            monitor_frame, text="Monitor disabled", font=("Segoe UI", 8), foreground="gray"
-        )
-        self.monitor_status.pack(pady=(8, 0))
+        # The text each value item currently shows
+        self._monitor_texts = dict.fromkeys(self._monitor_items, "--")
 
     def toggle_monitor(self):
         """Toggle resource monitoring on/off."""
         self._monitor_enabled = not self._monitor_enabled
 
         if self._monitor_enabled:
+            if not self._monitor_items:
+                self._build_monitor_panel()
             self.btn_monitor_toggle.config(text="Disable Monitor")
             self.monitor_status.config(text="Monitoring active", foreground=self.colors["success"])
             self._update_resource_stats()
         else:
             self.btn_monitor_toggle.config(text="Enable Monitor")
             self.monitor_status.config(text="Monitor disabled", foreground="gray")
-            if self._monitor_job:
-                self.window.after_cancel(self._monitor_job)
-                self._monitor_job = None
-            # Reset labels
-            self.cpu_label.config(text="--")
-            self.mem_label.config(text="--")
-            self.io_read_label.config(text="--")
-            self.io_write_label.config(text="--")
-            self.gpu_label.config(text="--")
+            self._cancel_monitor_job()
+            self._set_gpu_sampler(False)
+            # An in-flight worker may still be using it; _apply_stats closes it then
+            if not self._stats_worker_busy:
+                self._close_stats_sampler()
+            self._reset_monitor_labels()
 
     def _update_resource_stats(self):
-        """Update resource statistics using container stats."""
-        if not self._monitor_enabled:
+        """Main-thread tick: collect container stats in the background.
+
+        `<runtime> stats --no-stream` takes about a second, so it runs on a
+        worker thread; _apply_stats() updates the labels and schedules the
+        next tick once the result is in, so ticks never overlap.
+        """
+        self._cancel_monitor_job()
+        # Minimized: stop sampling until _on_window_map() resumes it
+        if not self._monitor_enabled or self._stats_worker_busy or not self._window_visible:
             return
+        if not self.detected:
+            # Detection still running; the config isn't known yet
+            self._monitor_job = self.window.after(2000, self._update_resource_stats)
+            return
+        self._stats_worker_busy = True
+        # Gather config on the main thread (it reads Tk widgets).
+        config = self._gather_config()
+        self._set_gpu_sampler(config.get("gpu") == "nvidia")
+        threading.Thread(
+            target=self._collect_stats_worker,
+            args=(config.get("runtime", "podman"), config.get("gpu")),
+            daemon=True,
+        ).start()
+
+    def _collect_stats_worker(self, runtime, gpu):
+        """Background: sample the container's stats; hand them to the main thread."""
+        try:
+            stats = self._collect_stats(runtime, gpu)
+        except Exception as e:
+            stats = e
+        self.window.after(0, self._apply_stats, stats)
 
+    def _collect_stats(self, runtime, gpu):
+        """Return the monitor label texts, or None if the container isn't running."""
+        if self._stats_sampler is None and self._last_running is False:
+            # The state poll already knows it's stopped; don't fork anything
+            return None
+        if self._cgroup_unavailable:
+            sample = self._runtime_stats_sample(runtime)
+        else:
+            sample = self._cgroup_stats_sample(runtime)
+            if self._cgroup_unavailable:
+                # Resolution just failed; fall back from this tick on
+                sample = self._runtime_stats_sample(runtime)
+        if sample is None:
+            return None
+        cpu_raw, mem_usage, net_in, net_out = sample
+
+        # Container stats show per-core usage, normalize to total system CPU
         try:
-            import re
-            import subprocess
+            cpu_normalized = float(cpu_raw) / _CPU_CORES
+            cpu_cores = float(cpu_raw) / 100
+            cpu_text = f"{cpu_normalized:.1f}%\n({cpu_cores:.1f} cores)"
+        except (ValueError, ZeroDivisionError):
+            cpu_text = f"{cpu_raw}%"
 
-            # Get container configuration
-            config = self._gather_config()
-            runtime = config.get("runtime", "podman")
-            container_name = "tlauncher"
+        # GPU stats (NVIDIA only), kept current by the nvidia-smi reader thread
+        gpu_text = self._gpu_util if gpu == "nvidia" else "N/A"
 
-            try:
-                # Get container stats (one-shot, no stream)
-                result = subprocess.run(
-                    [
-                        runtime,
-                        "stats",
-                        "--no-stream",
-                        "--format",
-                        "json" if runtime == "podman" else "table",
-                        container_name,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=3,
-                )
+        return {
+            "cpu": cpu_text,
+            "mem": mem_usage,
+            "net_in": net_in,
+            "net_out": net_out,
+            "gpu": gpu_text,
+        }
 
-                if result.returncode == 0 and result.stdout.strip():
-                    output = result.stdout.strip()
-
-                    if runtime == "podman":
-                        # Podman outputs JSON array with one object
-                        import json
-
-                        stats_list = json.loads(output)
-
-                        # Get first (and only) container stats
-                        if isinstance(stats_list, list) and len(stats_list) > 0:
-                            stats = stats_list[0]
-                        else:
-                            stats = stats_list if isinstance(stats_list, dict) else {}
-
-                        # CPU % (Podman uses 'cpu_percent' not 'CPU')
-                        # Container stats show per-core usage, normalize to total system CPU
-                        cpu_raw = stats.get("cpu_percent", "0%").replace("%", "")
-                        try:
-                            cpu_normalized = float(cpu_raw) / self._cpu_cores
-                            cpu_cores = float(cpu_raw) / 100
-                            self.cpu_label.config(
-                                text=f"{cpu_normalized:.1f}%\n({cpu_cores:.1f} cores)"
-                            )
-                        except (ValueError, ZeroDivisionError):
-                            self.cpu_label.config(text=f"{cpu_raw}%")
-
-                        # Memory (Podman uses 'mem_usage' not 'MemUsage')
-                        mem_usage = stats.get("mem_usage", "0B / 0B")
-                        mem_parts = mem_usage.split("/")
-                        if mem_parts:
-                            self.mem_label.config(text=mem_parts[0].strip())
-
-                        # Network I/O (Podman uses 'net_io' not 'NetIO')
-                        net_io = stats.get("net_io", "0B / 0B")
-                        net_parts = net_io.split("/")
-                        if len(net_parts) == 2:
-                            self.io_read_label.config(text=net_parts[0].strip())
-                            self.io_write_label.config(text=net_parts[1].strip())
+    def _set_gpu_sampler(self, enabled):
+        """Start (or restart, if it exited) or stop the background nvidia-smi.
 
-                    else:
-                        # Docker outputs table format
-                        # Parse the output line (skip header if present)
-                        lines = output.split("\n")
-                        data_line = lines[-1] if len(lines) > 0 else ""
-
-                        # Format: CONTAINER ID   NAME   CPU %   MEM USAGE / LIMIT   MEM %   NET I/O   BLOCK I/O   PIDS
-                        parts = re.split(r"\s{2,}", data_line.strip())
-
-                        if len(parts) >= 3:
-                            # CPU % (index 2)
-                            # Container stats show per-core usage, normalize to total system CPU
-                            cpu_raw = parts[2].replace("%", "")
-                            try:
-                                cpu_normalized = float(cpu_raw) / self._cpu_cores
-                                cpu_cores = float(cpu_raw) / 100
-                                self.cpu_label.config(
-                                    text=f"{cpu_normalized:.1f}%\n({cpu_cores:.1f} cores)"
-                                )
-                            except (ValueError, ZeroDivisionError):
-                                self.cpu_label.config(text=f"{cpu_raw}%")
-
-                            # MEM USAGE (index 3)
-                            if len(parts) >= 4:
-                                mem_usage = parts[3].split("/")[0].strip()
-                                self.mem_label.config(text=mem_usage)
-
-                            # NET I/O (index 5)
-                            if len(parts) >= 6:
-                                net_io = parts[5]
-                                net_parts = net_io.split("/")
-                                if len(net_parts) == 2:
-                                    self.io_read_label.config(text=net_parts[0].strip())
-                                    self.io_write_label.config(text=net_parts[1].strip())
-
-                    # GPU stats (NVIDIA only)
-                    try:
-                        if config.get("gpu") == "nvidia":
-                            gpu_result = subprocess.run(
-                                [
-                                    "nvidia-smi",
-                                    "--query-gpu=utilization.gpu",
-                                    "--format=csv,noheader,nounits",
-                                ],
-                                capture_output=True,
-                                text=True,
-                                timeout=1,
-                            )
-                            if gpu_result.returncode == 0:
-                                gpu_util = gpu_result.stdout.strip()
-                                self.gpu_label.config(text=f"{gpu_util}%")
-                            else:
-                                self.gpu_label.config(text="--")
-                        else:
-                            self.gpu_label.config(text="N/A")
-                    except (FileNotFoundError, subprocess.TimeoutExpired):
-                        self.gpu_label.config(text="--")
+        One `nvidia-smi -lms 2000` process prints the utilization every two
+        seconds, instead of paying its startup and driver init on every tick.
+        """
+        proc = self._gpu_smi
+        if not enabled:
+            if proc is not None:
+                proc.terminate()
+                proc.wait()
+                self._gpu_smi = None
+            self._gpu_util = "--"
+            return
+        if proc is not None and proc.poll() is None:
+            return
+        try:
+            proc = subprocess.Popen(
+                [
+                    "nvidia-smi",
+                    "--query-gpu=utilization.gpu",
+                    "--format=csv,noheader,nounits",
+                    "-lms",
+                    "2000",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError:
+            self._gpu_smi = None
+            self._gpu_util = "--"
+            return
+        self._gpu_smi = proc
+        threading.Thread(target=self._gpu_reader, args=(proc,), daemon=True).start()
+
+    def _gpu_reader(self, proc):
+        """Background: track the latest nvidia-smi reading (no Tk access)."""
+        for line in proc.stdout:
+            value = line.strip()
+            if value:
+                self._gpu_util = f"{value}%"
+        proc.stdout.close()
+        if self._gpu_smi is proc:
+            self._gpu_util = "--"
+
+    def _cgroup_stats_sample(self, runtime):
+        """
+        Read the container's cgroup v2 counters (no fork once the cgroup is found).
+
+        The sampler is resolved on first use and kept until the container's
+        cgroup disappears. If the container runs but its counters can't be
+        read, _cgroup_unavailable is set so later ticks skip straight to the
+        `<runtime> stats` fallback.
 
+        Returns:
+            tuple: (cpu_percent, mem_usage, net_in, net_out), or None if the
+            container isn't running or the counters aren't available
+        """
+        sampler = self._stats_sampler
+        if sampler is None:
+            pid = container_pid(runtime)
+            if not pid:
+                return None
+            sampler = CgroupStats.for_pid(pid)
+            if sampler is None:
+                self._cgroup_unavailable = True
+                return None
+            self._stats_sampler = sampler
+            # Give the first CPU reading a real interval to measure over
+            time.sleep(0.5)
+
+        sample = sampler.sample()
+        if sample is None:
+            self._close_stats_sampler()
+            return None
+
+        def _net(value):
+            return None if value is None else format_bytes(value)
+
+        return (
+            sample["cpu_percent"],
+            format_bytes(sample["mem_usage"]),
+            _net(sample["net_rx"]),
+            _net(sample["net_tx"]),
+        )
+
+    def _close_stats_sampler(self):
+        """Release the cgroup sampler's file handles."""
+        if self._stats_sampler is not None:
+            self._stats_sampler.close()
+            self._stats_sampler = None
+
+    def _runtime_stats_sample(self, runtime):
+        """
+        Fallback: fork `<runtime> stats --no-stream` and parse its output.
+
+        Returns:
+            tuple: (cpu_percent, mem_usage, net_in, net_out) as printed by the
+            runtime, or None if the container isn't running
+        """
+        container_name = "tlauncher"
+        try:
+            # Get container stats (one-shot, no stream)
+            result = subprocess.run(
+                [
+                    runtime,
+                    "stats",
+                    "--no-stream",
+                    "--format",
+                    "json" if runtime == "podman" else DOCKER_STATS_FORMAT,
+                    container_name,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=3,
+            )
+            if result.returncode != 0 or not result.stdout.strip():
+                # Container not running or not found
+                return None
+            output = result.stdout.strip()
+
+            if runtime == "podman":
+                # Podman outputs JSON array with one object
+                stats_list = _json_loads(output)
+
+                # Get first (and only) container stats
+                if isinstance(stats_list, list) and len(stats_list) > 0:
+                    stats = stats_list[0]
                 else:
-                    # Container not running or not found
-                    self._reset_monitor_labels()
+                    stats = stats_list if isinstance(stats_list, dict) else {}
 
-            except (subprocess.TimeoutExpired, ValueError, json.JSONDecodeError):
-                self._reset_monitor_labels()
+                # Podman uses 'cpu_percent', 'mem_usage' and 'net_io'
+                cpu_raw = stats.get("cpu_percent", "0%").replace("%", "")
+                mem_usage = stats.get("mem_usage", "0B / 0B").partition("/")[0].strip()
+                net_io = stats.get("net_io", "0B / 0B")
+            else:
+                # Docker: "cpu|mem usage / limit|net in / net out"
+                parts = output.split("|")
+                if len(parts) != 3:
+                    return None
+                cpu_raw = parts[0].replace("%", "")
+                mem_usage = parts[1].partition("/")[0].strip()
+                net_io = parts[2]
+        except (subprocess.TimeoutExpired, ValueError):
+            return None
 
-        except Exception as e:
-            self.log(f"Monitor error: {e}")
+        net_in, sep, net_out = net_io.partition("/")
+        if not sep:
+            return cpu_raw, mem_usage, None, None
+        return cpu_raw, mem_usage, net_in.strip(), net_out.strip()
 
-        # Schedule next update (2 seconds)
-        if self._monitor_enabled:
-            self._monitor_job = self.window.after(2000, self._update_resource_stats)
+    def _apply_stats(self, stats):
+        """Main thread: show a _collect_stats() result and schedule the next tick."""
+        self._stats_worker_busy = False
+        if not self._monitor_enabled:
+            self._close_stats_sampler()
+            return
+
+        if isinstance(stats, Exception):
+            self.log(f"Monitor error: {stats}")
+        elif stats is None:
+            self._reset_monitor_labels()
+        else:
+            self._set_monitor_texts(stats)
+
+        # Schedule next update (2 seconds); only ever one pending
+        self._cancel_monitor_job()
+        self._monitor_job = self.window.after(2000, self._update_resource_stats)
+
+    def _cancel_monitor_job(self):
+        """Cancel the pending monitor tick, if any."""
+        if self._monitor_job:
+            self.window.after_cancel(self._monitor_job)
+            self._monitor_job = None
 
     def _reset_monitor_labels(self):
         """Reset monitor labels when container is not running."""
-        self.cpu_label.config(text="--")
-        self.mem_label.config(text="--")
-        self.io_read_label.config(text="--")
-        self.io_write_label.config(text="--")
-        self.gpu_label.config(text="--")
+        self._set_monitor_texts(dict.fromkeys(self._monitor_items, "--"))
+
+    def _set_monitor_texts(self, texts):
+        """Update the monitor labels whose text changed.
+
+        Most ticks repeat some values (GPU N/A, a stopped container's "--"), and
+        each itemconfigure is a Tcl round-trip plus a redraw; comparing with the
+        last text set needs no Tcl call. A None value means the runtime didn't
+        report it, so the last one stays.
+        """
+        for key, text in texts.items():
+            if text is not None and self._monitor_texts.get(key) != text:
+                self.stats_canvas.itemconfigure(self._monitor_items[key], text=text)
+                self._monitor_texts[key] = text
 
     def _create_profiles_panel(self, parent_frame):
         """Create profiles management panel."""
@@ -803,8 +1021,6 @@ class MinecraftLauncherGUI:
     @staticmethod
     def _profile_disk_size(profile_data: dict, base: "Path") -> int:
         """Return total bytes used by a profile's version directory."""
-        import os
-
         version_id = profile_data.get("lastVersionId", "")
         game_dir = profile_data.get("gameDir", "")
         if game_dir and game_dir.startswith("/home/app/.minecraft/"):
@@ -836,7 +1052,6 @@ class MinecraftLauncherGUI:
 
     def refresh_profiles(self):
         """Refresh the profiles list."""
-        import json
         from pathlib import Path
 
         self.profiles_listbox.delete(0, tk.END)
@@ -878,7 +1093,6 @@ class MinecraftLauncherGUI:
 
     def export_profile(self):
         """Export selected profile to ZIP file."""
-        import json
         import zipfile
         from pathlib import Path
         from tkinter import filedialog, messagebox
@@ -988,7 +1202,6 @@ class MinecraftLauncherGUI:
 
     def import_profile_from_url(self):
         """Import profile from a URL: download to a temp file, then import."""
-        import os
         import tempfile
         import urllib.request
         from pathlib import Path
@@ -1026,7 +1239,6 @@ class MinecraftLauncherGUI:
 
     def _import_profile_zip(self, zip_path, source_label=None):
         """Import a profile from a local ZIP path (shared by file and URL import)."""
-        import json
         import zipfile
         from pathlib import Path
         from tkinter import messagebox
@@ -1128,7 +1340,6 @@ class MinecraftLauncherGUI:
 
     def delete_profile(self):
         """Delete selected profile."""
-        import json
         from pathlib import Path
         from tkinter import messagebox
 
@@ -1206,8 +1417,6 @@ class MinecraftLauncherGUI:
 
     def open_profile_folder(self):
         """Open the selected profile's version folder in the file manager."""
-        import json
-        import subprocess
         from pathlib import Path
         from tkinter import messagebox
 
@@ -1315,8 +1524,6 @@ class MinecraftLauncherGUI:
         Returns a dict of the parsed fields, or None if the index is invalid.
         Raises on unexpected errors so the caller can surface them.
         """
-        import json
-        import re
         from pathlib import Path
 
         profiles_file = Path(__file__).parent / "home" / "launcher_profiles.json"
@@ -1624,7 +1831,6 @@ class MinecraftLauncherGUI:
         podman.socket/docker.service systemd check, which read as 'down' for
         rootless podman even though podman was fully working.
         """
-        import subprocess
 
         def _runtime_ok(rt):
             try:
@@ -1652,16 +1858,16 @@ class MinecraftLauncherGUI:
         """
         if running is None:
             return
-        # Doctor is always available (read-only diagnostic).
-        self.btn_doctor.config(state=tk.NORMAL)
         if running:
-            self.btn_start.config(state=tk.DISABLED)
-            self.btn_stop.config(state=tk.NORMAL)
-            self.btn_restart.config(state=tk.NORMAL)
-        elif not self._in_transition():
-            self.btn_start.config(state=tk.NORMAL)
-            self.btn_stop.config(state=tk.DISABLED)
-            self.btn_restart.config(state=tk.DISABLED)
+            self._set_control_layout("running")
+        elif not (self._in_transition() or self._start_pending or self._rebuild_busy):
+            self._set_control_layout("stopped")
+
+    def _set_control_layout(self, layout: str):
+        """Apply a _CONTROL_LAYOUTS entry. Doctor is read-only and always enabled."""
+        buttons = (self.btn_start, self.btn_stop, self.btn_restart)
+        for button, state in zip(buttons, _CONTROL_LAYOUTS[layout]):
+            button.config(state=state)
 
     def _in_transition(self) -> bool:
         """True while a start/stop/restart is in flight, bounded to 20s.
@@ -1679,8 +1885,6 @@ class MinecraftLauncherGUI:
         `compose ps` output does not read as running (which would wrongly disable
         the Start button).
         """
-        import subprocess
-
         runtime = config.get("runtime", "podman")
         try:
             result = subprocess.run(
@@ -1700,7 +1904,8 @@ class MinecraftLauncherGUI:
         """
         # _sync_control_buttons applies its own running/transition logic.
         self._sync_control_buttons(self._last_running)
-        if not self._state_worker_busy:
+        # Until detection finishes there is no config to probe with
+        if not self._state_worker_busy and self.detected:
             self._state_worker_busy = True
             # Gather config on the main thread (it reads Tk widgets).
             config = self._gather_config()
@@ -1716,8 +1921,6 @@ class MinecraftLauncherGUI:
 
     def _check_for_updates_async(self):
         """Background thread: compare local HEAD SHA with remote and surface a banner if behind."""
-        import subprocess
-
         repo = str(Path(__file__).parent)
         try:
             local = subprocess.run(
@@ -1752,8 +1955,6 @@ class MinecraftLauncherGUI:
 
     def _do_update(self):
         """Pull latest changes from origin on a background thread."""
-        import subprocess
-
         confirm = messagebox.askyesno(
             "Update Launcher",
             "Pull the latest changes from GitHub?\n\n"
@@ -1771,8 +1972,8 @@ class MinecraftLauncherGUI:
 
                 def _fetch_err():
                     self.log(f"✗ git fetch failed:\n{fetch.stderr.strip()}")
-                    messagebox.showerror(
-                        "Update Failed", f"git fetch failed:\n\n{fetch.stderr.strip()}"
+                    self._notify(
+                        "showerror", "Update Failed", f"git fetch failed:\n\n{fetch.stderr.strip()}"
                     )
 
                 self.window.after(0, _fetch_err)
@@ -1802,14 +2003,17 @@ class MinecraftLauncherGUI:
                     self.log(result.stdout.strip())
                     self.log("✓ Update complete — please restart the launcher")
                     self._update_frame.pack_forget()
-                    messagebox.showinfo(
+                    self._notify(
+                        "showinfo",
                         "Update Complete",
                         "Launcher updated successfully.\n\nPlease restart the launcher.",
                     )
                 else:
                     self.log(f"✗ git pull failed:\n{result.stderr.strip()}")
-                    messagebox.showerror(
-                        "Update Failed", f"git pull returned an error:\n\n{result.stderr.strip()}"
+                    self._notify(
+                        "showerror",
+                        "Update Failed",
+                        f"git pull returned an error:\n\n{result.stderr.strip()}",
                     )
 
             self.window.after(0, _on_done)
@@ -1817,17 +2021,60 @@ class MinecraftLauncherGUI:
         threading.Thread(target=_pull, daemon=True).start()
 
     def _detect_and_load(self):
-        """Detect system and load configuration."""
+        """Detect system and load configuration in the background.
+
+        Detection spawns several probes (lspci, pactl, ...); running it on a
+        worker lets the window show immediately. The buttons that act on the
+        config stay disabled until _apply_detection() has filled it in - unless
+        the saved config pins every setting, in which case they are enabled as
+        soon as the worker has read it.
+        """
         self.log("Detecting system configuration...")
+        for button in self._config_buttons():
+            button.config(state=tk.DISABLED)
 
-        # Detect system
-        self.detected = detect_system()
+        def _detect():
+            saved = load_config()
+            if all(saved.get(key) for key, _, _ in self._config_fields):
+                self.window.after(0, self._apply_saved_config, saved)
+            detected = get_cached_detection()
+            self.window.after(0, self._apply_detection, detected, saved)
 
-        # Load saved config
-        saved = load_config()
+        threading.Thread(target=_detect, daemon=True).start()
+
+    def _apply_saved_config(self, saved):
+        """Use a fully pinned saved config before detection has finished.
+
+        Until _apply_detection() runs, the pinned values also stand in for the
+        detected ones, so choosing 'auto' meanwhile resolves to them.
+        """
+        self.config = merge_config({}, saved)
+        self.detected = {key: self.config[key] for key, _, _ in self._config_fields}
+        for key, var, _ in self._config_fields:
+            var.set(self.config[key])
+        self._pinned_values = {key: var.get() for key, var, _ in self._config_fields}
+        for button in self._config_buttons():
+            button.config(state=tk.NORMAL)
+
+    def _config_buttons(self):
+        """Buttons whose handlers need the detected config."""
+        return (
+            self.btn_start,
+            self.btn_doctor,
+            self.btn_save,
+            self.btn_rebuild,
+            self.btn_report_bug,
+        )
+
+    def _apply_detection(self, detected, saved):
+        """Main thread: apply detection results and the saved config to the UI."""
+        self.detected = detected
+        self._invalidate_config_cache()
 
         # Merge (saved overrides detection)
         self.config = merge_config(self.detected, saved)
+        for button in self._config_buttons():
+            button.config(state=tk.NORMAL)
 
         # Update UI
         self._update_ui_from_config()
@@ -1841,121 +2088,106 @@ class MinecraftLauncherGUI:
         self._check_existing_container()
 
     def _check_existing_container(self):
-        """Check if the container is already running and update UI accordingly."""
-        try:
-            import subprocess
-
-            runtime = self.detected.get("runtime", "podman")
-            container_name = "tlauncher"
+        """Check (in the background) if the container is already running and update UI."""
+        self._probe_container_async(
+            {"runtime": self.detected.get("runtime", "podman")}, self._on_existing_container
+        )
 
-            # Check container status
-            result = subprocess.run(
-                [runtime, "ps", "--filter", f"name={container_name}", "--format", "{{.Names}}"],
-                capture_output=True,
-                text=True,
-                timeout=3,
-            )
+    def _on_existing_container(self, running):
+        """Main thread: apply the startup container check."""
+        if running:
+            # Container is already running
+            self.log("\n⚠️  Detected existing Minecraft instance!")
+            self.log("Container is already running.")
+            self._update_status("already_running")
+            self._set_control_layout("running")
+
+            # Create manager instance for the running container
+            self._get_manager(self.config)
+        else:
+            # Container not running (or the check failed)
+            self.log("\n🚀 Ready to start!")
+            self._update_status("ready")
 
-            if result.returncode == 0 and container_name in result.stdout:
-                # Container is already running
-                self.log("\n⚠️  Detected existing Minecraft instance!")
-                self.log("Container is already running.")
-                self._update_status("Already Running", "warning")
+    def _probe_container_async(self, config, callback):
+        """Run _container_is_running() on a worker thread; callback(running) on the main thread.
 
-                # Disable start button, enable stop button
-                self.btn_start.config(state="disabled")
-                self.btn_stop.config(state="normal")
-                self.btn_restart.config(state="normal")
+        `<runtime> ps` can take seconds on a cold start, which would freeze the
+        window if run inline.
+        """
 
-                # Create manager instance for the running container
-                self.manager = ContainerManager(self.config)
-            else:
-                # Container not running
-                self.log("\n🚀 Ready to start!")
-                self._update_status("Ready", "success")
+        def _probe():
+            running = self._container_is_running(config)
+            self.window.after(0, callback, running)
 
-        except Exception:
-            # If check fails, assume not running
-            self.log("\n🚀 Ready to start!")
-            self._update_status("Ready", "success")
+        threading.Thread(target=_probe, daemon=True).start()
 
     def _update_ui_from_config(self):
-        """Update UI dropdowns from current config."""
-        self.runtime_var.set(
-            "auto"
-            if not self.config.get("runtime") or self.config["runtime"] == self.detected["runtime"]
-            else self.config["runtime"]
-        )
-        self.gpu_var.set(
-            "auto"
-            if not self.config.get("gpu") or self.config["gpu"] == self.detected["gpu"]
-            else self.config["gpu"]
-        )
-        self.display_var.set(
-            "auto"
-            if not self.config.get("display") or self.config["display"] == self.detected["display"]
-            else self.config["display"]
-        )
-        self.audio_var.set(
-            "auto"
-            if not self.config.get("audio") or self.config["audio"] == self.detected["audio"]
-            else self.config["audio"]
-        )
+        """Update UI dropdowns from current config.
 
-        # Show detected values only if different from 'auto'
-        self.runtime_status_label.config(
-            text=f"({self.detected['runtime']})" if self.runtime_var.get() == "auto" else ""
-        )
-        self.gpu_status_label.config(
-            text=f"({self.detected['gpu']})" if self.gpu_var.get() == "auto" else ""
-        )
-        self.display_status_label.config(
-            text=f"({self.detected['display']})" if self.display_var.get() == "auto" else ""
-        )
-        self.audio_status_label.config(
-            text=f"({self.detected['audio']})" if self.audio_var.get() == "auto" else ""
-        )
+        Dropdowns changed since _apply_saved_config() keep the user's choice.
+        """
+        config = self.config
+        detected_values = self.detected
+        pinned, self._pinned_values = self._pinned_values, {}
+        for key, var, status_label in self._config_fields:
+            detected = detected_values[key]
+            if key in pinned and var.get() != pinned[key]:
+                is_auto = var.get() == "auto"
+            else:
+                value = config.get(key)
+                is_auto = not value or value == detected
+                var.set("auto" if is_auto else value)
+            # Show detected values only if different from 'auto'
+            status_label.config(text=f"({detected})" if is_auto else "")
+
+    def _invalidate_config_cache(self, *_):
+        """Forget the cached config (variable trace callback)."""
+        self._config_cache = None
 
     def _gather_config(self) -> Dict[str, str]:
-        """Gather configuration from UI."""
-        runtime = self.runtime_var.get()
-        gpu = self.gpu_var.get()
-        display = self.display_var.get()
-        audio = self.audio_var.get()
+        """Gather configuration from UI.
 
-        # Convert 'auto' back to detected values
-        return {
-            "runtime": self.detected["runtime"] if runtime == "auto" else runtime,
-            "gpu": self.detected["gpu"] if gpu == "auto" else gpu,
-            "display": self.detected["display"] if display == "auto" else display,
-            "audio": self.detected["audio"] if audio == "auto" else audio,
-            "auto_xhost": True,
-        }
+        The dict is cached until a dropdown or the detection result changes, and
+        is shared between callers - treat it as read-only.
+        """
+        if self._config_cache is None:
+            self._config_cache = self._build_config()
+        return self._config_cache
+
+    def _build_config(self) -> Dict[str, str]:
+        """Read the dropdowns and resolve 'auto' to the detected values."""
+        detected = self.detected
+        config = {}
+        for key, var, _ in self._config_fields:
+            value = var.get()
+            # Convert 'auto' back to detected values
+            config[key] = detected[key] if value == "auto" else value
+        config["auto_xhost"] = True
+        return config
 
     def start_minecraft(self):
         """Start button handler."""
-        # Check if already running
-        try:
-            import subprocess
+        config = self._gather_config()
+        # Check if already running; the start continues in the probe's callback.
+        # Disabled (and kept so by the state poll) so a second click can't
+        # start twice.
+        self._start_pending = True
+        self.btn_start.config(state=tk.DISABLED)
+        self._probe_container_async(config, lambda running: self._start_if_stopped(config, running))
 
-            runtime = self.detected.get("runtime", "podman")
-            result = subprocess.run(
-                [runtime, "ps", "--filter", "name=tlauncher", "--format", "{{.Names}}"],
-                capture_output=True,
-                text=True,
-                timeout=3,
+    def _start_if_stopped(self, config, running):
+        """Main thread: continue a Start press once the running check is in."""
+        if running:
+            self._start_pending = False
+            self._sync_control_buttons(True)
+            self.log("\n⚠️  Container is already running!")
+            self._notify(
+                "showinfo",
+                "Already Running",
+                "Minecraft container is already running.\nUse Stop to stop it first.",
             )
-            if result.returncode == 0 and "tlauncher" in result.stdout:
-                self.log("\n⚠️  Container is already running!")
-                messagebox.showinfo(
-                    "Already Running",
-                    "Minecraft container is already running.\nUse Stop to stop it first.",
-                )
-                return
-        except Exception:
-            pass  # If check fails, continue with start
-
-        config = self._gather_config()
+            return
 
         # Build the image automatically if it's missing (first run). No need to
         # click Rebuild manually; that's only for picking up Containerfile edits.
@@ -1967,15 +2199,35 @@ class MinecraftLauncherGUI:
         self._do_start(config)
 
     def _do_start(self, config=None):
-        """Validate, set permissions, and launch the container."""
+        """Validate (in the background), set permissions, and launch the container."""
+        # Imported on first use (here, on the main thread) to keep launch fast
+        from core.validator import run_xhost_if_needed, validate_system
+
         if config is None:
             config = self._gather_config()
 
-        # Validate
-        self.log("\n" + "=" * 50)
-        self.log("Validating system...")
-        valid, issues = validate_system(config)
+        # Validate. The checks probe devices, sockets and the runtime, so they
+        # run on a worker; _start_validated() picks up on the main thread.
+        self.log("\n" + "=" * 50 + "\nValidating system...")
+        self._start_pending = True
+        self.btn_start.config(state=tk.DISABLED)
+
+        def _validate():
+            valid, issues = validate_system(config)
+            # Grant X11 access here too (x11 and XWayland both use the X
+            # server) so `xhost` doesn't block the main loop either
+            xhost_ok = None
+            if valid and config["display"] in ("x11", "wayland") and config.get("auto_xhost", True):
+                xhost_ok = run_xhost_if_needed(config)
+            self.window.after(0, self._start_validated, config, valid, issues, xhost_ok)
+
+        threading.Thread(target=_validate, daemon=True).start()
+
+    def _start_validated(self, config, valid, issues, xhost_ok=None):
+        """Main thread: report validation results and launch if they passed.
 
+        xhost_ok is the X11 permission grant's result, or None if none was needed.
+        """
         if issues:
             for issue in issues:
                 symbol = "✗" if issue.is_blocking() else "⚠"
@@ -1985,18 +2237,21 @@ class MinecraftLauncherGUI:
 
         if not valid:
             self.log("\n✗ Validation failed. Cannot start.")
-            self._update_status("Validation failed", "error")
-            messagebox.showerror(
-                "Validation Failed", "System validation failed. Check the output for details."
+            self._update_status("validation_failed")
+            self._start_pending = False
+            self.btn_start.config(state=tk.NORMAL)
+            self._notify(
+                "showerror",
+                "Validation Failed",
+                "System validation failed. Check the output for details.",
             )
             return
 
         self.log("✓ Validation passed")
 
-        # Run xhost if needed (x11 and XWayland both use the X server)
-        if config["display"] in ("x11", "wayland") and config.get("auto_xhost", True):
+        if xhost_ok is not None:
             self.log("Setting X11 permissions...")
-            if run_xhost_if_needed(config):
+            if xhost_ok:
                 self.log("✓ X11 permissions set")
             else:
                 self.log("⚠ Could not set X11 permissions automatically")
@@ -2007,24 +2262,26 @@ class MinecraftLauncherGUI:
         # Update UI state. Doctor stays enabled: it's a read-only diagnostic and
         # is useful to run at any time, including while the container is up.
         self._transition_at = time.monotonic()
-        self._update_status("Starting...", "warning")
-        self.btn_start.config(state=tk.DISABLED)
+        self._start_pending = False
+        self._update_status("starting")
+        self._set_control_layout("busy")
 
         # Start container in background thread
         _error_flags = {"nvidia_ldcache": False}
 
-        def output_callback(line):
-            self.log(line)
-            if "nvidia-container-cli" in line or "ldcache error" in line:
+        def output_batch_callback(lines):
+            # One Tk round-trip per batch of output rather than per line
+            text = "\n".join(lines)
+            if "nvidia-container-cli" in text or "ldcache error" in text:
                 _error_flags["nvidia_ldcache"] = True
+            self.window.after(0, self.log, text)
 
         def started_callback():
             # Launcher GUI is up; run UI update on main thread
             def _on_started():
                 self._transition_at = 0.0
-                self._update_status("Running", "success")
-                self.btn_stop.config(state=tk.NORMAL)
-                self.btn_restart.config(state=tk.NORMAL)
+                self._update_status("running")
+                self._set_control_layout("running")
                 self.log("\n✓ Container started successfully")
 
             self.window.after(0, _on_started)
@@ -2032,12 +2289,11 @@ class MinecraftLauncherGUI:
         def completion_callback(success):
             # Container process exited; run UI update on main thread
             def _on_exited():
+                from core.log_analyzer import analyze_lines
+
                 self._transition_at = 0.0
-                self._update_status("Stopped", "gray")
-                self.btn_start.config(state=tk.NORMAL)
-                self.btn_stop.config(state=tk.DISABLED)
-                self.btn_restart.config(state=tk.DISABLED)
-                self.btn_doctor.config(state=tk.NORMAL)
+                self._update_status("stopped")
+                self._set_control_layout("stopped")
                 if self._user_requested_stop:
                     self._user_requested_stop = False
                 elif success:
@@ -2045,7 +2301,8 @@ class MinecraftLauncherGUI:
                 else:
                     self.log("\n✗ Container exited with error")
                     if _error_flags["nvidia_ldcache"]:
-                        messagebox.showerror(
+                        self._notify(
+                            "showerror",
                             "NVIDIA Container Error",
                             "The NVIDIA container toolkit reported an ldcache error.\n\n"
                             "This usually means the toolkit is running in legacy mode "
@@ -2057,14 +2314,16 @@ class MinecraftLauncherGUI:
                             "  sudo nvidia-ctk config --set "
                             "nvidia-container-runtime.mode=csv",
                         )
-                    elif messagebox.askyesno(
-                        "Minecraft stopped", "Minecraft exited unexpectedly.\n\nRestart?"
+                    elif self._notify(
+                        "askyesno",
+                        "Minecraft stopped",
+                        "Minecraft exited unexpectedly.\n\nRestart?",
                     ):
                         self.start_minecraft()
 
                 # Always run log analysis; only show output if there are findings
-                log_lines = self.log_text.get("1.0", tk.END).splitlines()
-                findings = analyze_lines(log_lines)
+                self._flush_log()
+                findings = analyze_lines(list(self._log_lines))
                 if findings:
                     self.log("\n" + "─" * 50)
                     self.log("Log Analysis:")
@@ -2081,41 +2340,53 @@ class MinecraftLauncherGUI:
         start_container_async(
             config,
             detached=False,
-            output_callback=output_callback,
             started_callback=started_callback,
             completion_callback=completion_callback,
+            output_batch_callback=output_batch_callback,
+            manager=self._get_manager(config),
         )
 
+    def _get_manager(self, config):
+        """Return self.manager, rebuilt only when the config it was made for changed.
+
+        A manager whose `compose up` is still attached is kept regardless, so
+        Stop/Restart can signal that process and tear down what it started.
+        """
+        key = tuple(sorted(config.items()))
+        if self.manager is None or (
+            key != self._manager_config_key and self.manager.process is None
+        ):
+            self.manager = ContainerManager(config)
+            self._manager_config_key = key
+        return self.manager
+
     def stop_minecraft(self):
         """Stop button handler."""
         config = self._gather_config()
 
         self._user_requested_stop = True
         self._transition_at = time.monotonic()
-        self.log("\n" + "=" * 50)
-        self.log("Stopping container...")
-        self._update_status("Stopping...", "warning")
+        self.log("\n" + "=" * 50 + "\nStopping container...")
+        self._update_status("stopping")
+
+        manager = self._get_manager(config)
 
         def stop_worker():
-            manager = ContainerManager(config)
             success = manager.stop()
 
             def _on_stop_done():
                 self._transition_at = 0.0
                 if success:
-                    self._update_status("Stopped", "gray")
-                    self.btn_start.config(state=tk.NORMAL)
-                    self.btn_stop.config(state=tk.DISABLED)
-                    self.btn_restart.config(state=tk.DISABLED)
-                    self.btn_doctor.config(state=tk.NORMAL)
+                    self._update_status("stopped")
+                    self._set_control_layout("stopped")
                     self.log("✓ Container stopped")
                 else:
-                    self._update_status("Running", "success")
+                    self._update_status("running")
                     self.log("✗ Failed to stop container")
 
             self.window.after(0, _on_stop_done)
 
-        threading.Thread(target=stop_worker, daemon=True).start()
+        self._executor.submit(stop_worker)
 
     def restart_minecraft(self):
         """Restart button handler: stop the container, then start it fresh.
@@ -2127,24 +2398,23 @@ class MinecraftLauncherGUI:
         """
         config = self._gather_config()
 
-        self.log("\n" + "=" * 50)
-        self.log("Restarting container...")
-        self._update_status("Restarting...", "warning")
+        self.log("\n" + "=" * 50 + "\nRestarting container...")
+        self._update_status("restarting")
         self._transition_at = time.monotonic()
-        self.btn_restart.config(state=tk.DISABLED)
-        self.btn_stop.config(state=tk.DISABLED)
+        self._set_control_layout("busy")
 
         # Flag the stop as intentional so the currently-running start()'s
         # completion callback doesn't prompt "Minecraft exited unexpectedly".
         self._user_requested_stop = True
 
+        manager = self._get_manager(config)
+
         def restart_worker():
-            manager = ContainerManager(config)
             manager.stop()
             # Re-launch on the main thread through the normal start flow.
             self.window.after(0, lambda: self._do_start(config))
 
-        threading.Thread(target=restart_worker, daemon=True).start()
+        self._executor.submit(restart_worker)
 
     def rebuild_image(self, then_start=False):
         """Rebuild the container image using the configured runtime.
@@ -2152,16 +2422,17 @@ class MinecraftLauncherGUI:
         If then_start is True, automatically start the container once the build
         succeeds (used when Start triggers a first-run build).
         """
-        import subprocess
-
         config = self._gather_config()
         runtime = config.get("runtime", "podman")
         repo_dir = str(Path(__file__).parent)
 
-        self.log(f"\n{'=' * 50}")
-        self.log(f"🔨 Rebuilding container image with {runtime}...")
-        self.log("This may take several minutes on the first run.\n")
+        self.log(
+            f"\n{'=' * 50}\n"
+            f"🔨 Rebuilding container image with {runtime}...\n"
+            "This may take several minutes on the first run.\n"
+        )
 
+        self._rebuild_busy = True
         self.btn_rebuild.config(state=tk.DISABLED)
         self.btn_start.config(state=tk.DISABLED)
 
@@ -2190,21 +2461,27 @@ class MinecraftLauncherGUI:
                 success = False
 
             def _on_done():
+                self._rebuild_busy = False
                 self.btn_rebuild.config(state=tk.NORMAL)
-                self.btn_start.config(state=tk.NORMAL)
+                if not (success and then_start):
+                    # A first-run build that failed abandons its Start press
+                    self._start_pending = False
+                    self.btn_start.config(state=tk.NORMAL)
                 if success:
                     if then_start:
                         self.log("\n✓ Image built — starting Minecraft...")
                         self._do_start()
                     else:
                         self.log("\n✓ Image rebuilt — you can now start Minecraft")
-                        messagebox.showinfo(
+                        self._notify(
+                            "showinfo",
                             "Build Complete",
                             "Container image rebuilt successfully.\nYou can now start Minecraft.",
                         )
                 else:
                     self.log("\n✗ Build failed — check the output above")
-                    messagebox.showerror(
+                    self._notify(
+                        "showerror",
                         "Build Failed",
                         "Container image build failed.\nCheck the console output for details.",
                     )
@@ -2216,7 +2493,6 @@ class MinecraftLauncherGUI:
     def report_bug(self):
         """Open a pre-filled GitHub bug report with current system info."""
         import platform
-        import subprocess
         import urllib.parse
         import webbrowser
 
@@ -2237,8 +2513,8 @@ class MinecraftLauncherGUI:
 
         os_info = platform.platform()
 
-        log_raw = self.log_text.get("1.0", "end-1c")
-        recent_logs = "\n".join(log_raw.splitlines()[-40:])
+        self._flush_log()
+        recent_logs = "\n".join(list(self._log_lines)[-40:])
 
         tb = "```"
         body = f"""## Description
@@ -2296,10 +2572,47 @@ class MinecraftLauncherGUI:
 
     def run_doctor(self):
         """Doctor button handler - run validation."""
-        self.log("\n" + "=" * 50)
-        self.log("Running system diagnostics...\n")
+        from core.validator import validate_system
+
+        self.log("\n" + "=" * 50 + "\nRunning system diagnostics...\n")
+        config = self._gather_config()
+
+        # Detection details and the deep checks run subprocess probes, so they
+        # go to a worker; _doctor_done() reports on the main thread.
+        def _diagnose():
+            details, detected = self._detection_details()
+            valid, issues = validate_system(config, deep=True)
+            self.window.after(0, self._doctor_done, details, detected, valid, issues)
+
+        threading.Thread(target=_diagnose, daemon=True).start()
 
-        details = get_detection_details()
+    def _detection_details(self):
+        """Worker thread: rescan the system, reused for _DOCTOR_DETAILS_TTL seconds.
+
+        Returns (details, detected). Startup detection may have come from the
+        on-disk cache, so every report probes afresh and then refreshes that
+        cache from the same (memoized) probes; detected is None when the
+        previous report was reused.
+        """
+        now = time.monotonic()
+        if self._details_cache is None or now - self._details_ts >= _DOCTOR_DETAILS_TTL:
+            self._details_cache = get_detection_details()
+            self._details_ts = now
+            return self._details_cache, get_cached_detection(force=True)
+        return self._details_cache, None
+
+    def _doctor_done(self, details, detected, valid, issues):
+        """Main thread: print the doctor report."""
+        if detected and detected != self.detected:
+            # Keep 'auto' in step with what the report shows
+            changed = ", ".join(
+                f"{key}: {self.detected.get(key)} → {value}"
+                for key, value in detected.items()
+                if self.detected.get(key) != value
+            )
+            self.log(f"⚠ Detection changed since startup ({changed})")
+            self.detected = detected
+            self._invalidate_config_cache()
 
         # Show detection details (kept in sync with the CLI doctor output)
         rt = details["runtime"]
@@ -2327,10 +2640,7 @@ class MinecraftLauncherGUI:
         else:
             self.log("  Host scale: 1x")
 
-        # Validate
-        config = self._gather_config()
         self.log("\nValidation:")
-        valid, issues = validate_system(config)
 
         if issues:
             for issue in issues:
@@ -2343,11 +2653,13 @@ class MinecraftLauncherGUI:
 
         if valid:
             self.log("\n✓ System ready!")
-            messagebox.showinfo("System Check", "System is ready to run Minecraft!")
+            self._notify("showinfo", "System Check", "System is ready to run Minecraft!")
         else:
             self.log("\n✗ System has errors")
-            messagebox.showwarning(
-                "System Check", "System has validation errors. Check the output for details."
+            self._notify(
+                "showwarning",
+                "System Check",
+                "System has validation errors. Check the output for details.",
             )
 
     def save_configuration(self):
@@ -2364,6 +2676,7 @@ class MinecraftLauncherGUI:
         }
 
         if save_config(save_data):
+            self._details_cache = None
             self.log("\n✓ Configuration saved")
             messagebox.showinfo("Configuration Saved", "Your configuration has been saved.")
         else:
@@ -2372,10 +2685,6 @@ class MinecraftLauncherGUI:
 
     def edit_configuration(self):
         """Open configuration file in text editor."""
-        import os
-        import subprocess
-        from pathlib import Path
-
         # Get config file path
         config_dir = Path.home() / ".config" / "minecraft-launcher"
         config_file = config_dir / "config.yaml"
@@ -2385,9 +2694,7 @@ class MinecraftLauncherGUI:
 
         # Create empty config file if it doesn't exist
         if not config_file.exists():
-            config_file.write_text(
-                "# Minecraft Launcher Launcher Configuration\n# Leave values empty to use auto-detection\n\nruntime: ''\ngpu: ''\ndisplay: ''\naudio: ''\nauto_xhost: true\n"
-            )
+            config_file.write_bytes(_DEFAULT_CONFIG_YAML)
             self.log("\n✓ Created new config file")
 
         # Open in default text editor
@@ -2414,11 +2721,16 @@ class MinecraftLauncherGUI:
 
     def clear_logs(self):
         """Clear the log output."""
+        self._log_buffer.clear()
+        self._log_lines.clear()
+        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete("1.0", tk.END)
+        self.log_text.config(state=tk.DISABLED)
 
     def copy_logs(self):
         """Copy full log content to the clipboard."""
-        content = self.log_text.get("1.0", tk.END)
+        self._flush_log()
+        content = "\n".join(self._log_lines)
         if content.strip():
             self.window.clipboard_clear()
             self.window.clipboard_append(content)
@@ -2426,42 +2738,78 @@ class MinecraftLauncherGUI:
             self.log("(Logs copied to clipboard)")
 
     def log(self, message: str):
-        """Append message to log output."""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.update()
-
-    def _update_status(self, text: str, color: str = "success"):
-        """Update status label with colored indicator."""
-        # Map color names to actual colors
-        color_map = {
-            "success": self.colors["success"],
-            "green": self.colors["success"],
-            "warning": self.colors["warning"],
-            "orange": self.colors["warning"],
-            "error": self.colors["error"],
-            "red": self.colors["error"],
-            "info": self.colors["info"],
-            "gray": "#888888",
-            "black": self.colors["fg"],
-        }
+        """Append message to log output.
 
-        actual_color = color_map.get(color, color)
-
-        # Add status indicator dot
-        if "Running" in text:
-            status_text = "● " + text.replace("Status: ", "")
-        elif "Starting" in text or "Stopping" in text or "Restarting" in text:
-            status_text = "◐ " + text.replace("Status: ", "")
-        elif "Stopped" in text or "Ready" in text:
-            status_text = "○ " + text.replace("Status: ", "")
-        elif "Failed" in text or "Error" in text:
-            status_text = "✗ " + text.replace("Status: ", "")
-        else:
-            status_text = "● " + text.replace("Status: ", "")
+        Messages are queued and written by one idle-time flush, so a burst of
+        log calls costs a single insert, re-wrap and scroll rather than one each.
+        Safe to call from any thread: only the main thread touches Tk, and
+        messages queued by workers are written by the _pump_logs() tick.
+        """
+        self._log_buffer.append(message + "\n")
+        if threading.current_thread() is not threading.main_thread():
+            return
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.window.after_idle(self._flush_log)
+
+    def _pump_logs(self):
+        """Main-thread tick: write log messages queued by worker threads."""
+        self._flush_log()
+        self.window.after(100, self._pump_logs)
+
+    def _flush_log(self):
+        """Write queued log messages to the log widget."""
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+        chunks = []
+        while self._log_buffer:
+            chunks.append(self._log_buffer.popleft())
+        text = "".join(chunks)
+        self._log_lines.extend(text.splitlines())
+        # Only follow the tail if the user hasn't scrolled up to read history
+        at_bottom = self.log_text.yview()[1] >= 0.999
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, text)
+        # Keep the widget bounded on long runs; drop the oldest lines
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - _MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+        self.log_text.config(state=tk.DISABLED)
+        if at_bottom:
+            self.log_text.see(tk.END)
+
+    def _notify(self, kind: str, title: str, message: str):
+        """Show a messagebox from an async callback, unless one is already open.
+
+        The dialogs are modal and run a nested event loop; a second one raised
+        meanwhile (e.g. a start failing while the previous error is still up)
+        is written to the log instead of stacking.
+
+        Args:
+            kind: messagebox function name ('showinfo', 'askyesno', ...)
+
+        Returns:
+            The dialog's result, or None if it was suppressed
+        """
+        if self._modal_open:
+            self.log(f"\n{title}: {message}")
+            return None
+        self._modal_open = True
+        try:
+            return getattr(messagebox, kind)(title, message)
+        finally:
+            self._modal_open = False
 
-        self.status_label.config(text=status_text, foreground=actual_color)
+    def _update_status(self, status: str):
+        """Show one of the _STATUSES in the status label."""
+        text, color = _STATUSES[status]
+        self.status_label.config(text=text, style=self._status_styles[color])
 
     def run(self):
         """Start the GUI main loop."""
-        self.window.mainloop()
+        try:
+            self.window.mainloop()
+        finally:
+            self._set_gpu_sampler(False)
+            self._executor.shutdown(wait=False)
@@ -155,6 +155,12 @@ Examples:
         "--follow", "-f", action="store_true", help="Follow log output (for logs command)"
     )
     parser.add_argument("--yes", "-y", action="store_true", help="Skip confirmation prompts")
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Don't print the compose command preview (for start command)",
+    )
 
     # Mode selection
     parser.add_argument("--no-gui", action="store_true", help="Force CLI mode (disable GUI)")